@@ -1,8 +1,9 @@
 """Attention Director Agent - Manages attention and prioritizes information."""
 
 import asyncio
+import time
 from typing import Dict, Any, List, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import deque
 import structlog
 
@@ -19,15 +20,16 @@ class FocusArea:
         self.theme = theme
         self.keywords = set(theme.lower().split())
         self.thought_history = [initial_thought]
-        self.first_seen = datetime.now()
-        self.last_reinforced = datetime.now()
+        # Monotonic seconds, for age and decay arithmetic
+        self.first_seen = time.monotonic()
+        self.last_reinforced = self.first_seen
         self.intensity = 0.5  # 0-1 scale
         self.thought_count = 1
         
     def reinforce(self, thought: str, priority: float):
         """Reinforce this focus area with a new related thought."""
         self.thought_history.append(thought)
-        self.last_reinforced = datetime.now()
+        self.last_reinforced = time.monotonic()
         self.thought_count += 1
         # Increase intensity based on priority and recency
         self.intensity = min(1.0, self.intensity + (priority * 0.2))
@@ -37,7 +39,7 @@ class FocusArea:
         
     def decay(self, decay_rate: float):
         """Apply time-based decay to focus intensity."""
-        time_since_reinforced = (datetime.now() - self.last_reinforced).total_seconds()
+        time_since_reinforced = time.monotonic() - self.last_reinforced
         decay_factor = decay_rate ** (time_since_reinforced / 60.0)  # Decay per minute
         self.intensity *= decay_factor
         
@@ -85,8 +87,9 @@ class AttentionDirectorAgent(BaseAgent):
         self.attention_queue = deque(maxlen=100)
         self.attention_history = deque(maxlen=1000)
         self.current_focus = None
-        self.focus_duration = timedelta(seconds=5)
-        self.last_focus_change = datetime.now()
+        self.focus_duration = 5.0  # seconds
+        self.last_focus_change = time.monotonic()
+        self._last_tool_analysis = self.last_focus_change
         
         # Track patterns for better filtering
         self.thought_patterns = {}
@@ -122,7 +125,7 @@ class AttentionDirectorAgent(BaseAgent):
                         budget=self.attention_budget)
         
         # Initialize tool registry if present
-        if hasattr(self, 'tool_registry'):
+        if self.tool_registry is not None:
             await self.tool_registry.initialize(self.agent_id)
         
         # Subscribe to all thought streams
@@ -163,7 +166,7 @@ class AttentionDirectorAgent(BaseAgent):
                     await self._manage_focus_areas()
                 
                 # Periodically analyze focus with tools
-                if hasattr(self, 'tool_registry') and self.focus_areas and not self.is_sleeping:
+                if self.tool_registry is not None and self.focus_areas and not self.is_sleeping:
                     await self._analyze_focus_with_tools()
                 
                 # Small delay
@@ -390,10 +393,10 @@ class AttentionDirectorAgent(BaseAgent):
     
     async def _update_focus(self):
         """Update current focus based on patterns and time."""
-        now = datetime.now()
+        now = time.monotonic()
         
         # Check if it's time to potentially shift focus
-        if (now - self.last_focus_change) > self.focus_duration:
+        if now - self.last_focus_change > self.focus_duration:
             # Analyze recent high-priority thoughts for themes
             recent_important = [
                 item for item in list(self.attention_history)[-20:]
@@ -575,7 +578,7 @@ class AttentionDirectorAgent(BaseAgent):
                 'theme': phrase,
                 'content': content,
                 'priority': priority,
-                'timestamp': datetime.now()
+                'timestamp': time.monotonic()
             })
     
     async def _check_theme_emergence(self):
@@ -586,10 +589,10 @@ class AttentionDirectorAgent(BaseAgent):
         # Count theme occurrences within persistence window
         theme_counts = {}
         theme_contents = {}
-        now = datetime.now()
+        now = time.monotonic()
         
         for entry in self.emerging_themes:
-            age = (now - entry['timestamp']).total_seconds()
+            age = now - entry['timestamp']
             if age <= self.persistence_threshold:
                 theme = entry['theme']
                 if theme not in theme_counts:
@@ -648,10 +651,7 @@ class AttentionDirectorAgent(BaseAgent):
     async def _analyze_focus_with_tools(self):
         """Periodically analyze focus areas using tools."""
         # Only analyze every 5 minutes
-        if not hasattr(self, '_last_tool_analysis'):
-            self._last_tool_analysis = datetime.now()
-        
-        time_since_analysis = (datetime.now() - self._last_tool_analysis).total_seconds()
+        time_since_analysis = time.monotonic() - self._last_tool_analysis
         if time_since_analysis < 300:  # 5 minutes
             return
         
@@ -682,7 +682,7 @@ class AttentionDirectorAgent(BaseAgent):
                             self.logger.info("Released focus area based on tool recommendation", 
                                            theme=theme_to_release)
                 
-                self._last_tool_analysis = datetime.now()
+                self._last_tool_analysis = time.monotonic()
                 
         except Exception as e:
             self.logger.error("Focus analysis with tools failed", error=str(e))
@@ -699,7 +699,7 @@ class AttentionDirectorAgent(BaseAgent):
                 "theme": focus.theme,
                 "intensity": focus.intensity,
                 "thought_count": focus.thought_count,
-                "age_seconds": (datetime.now() - focus.first_seen).total_seconds()
+                "age_seconds": time.monotonic() - focus.first_seen
             }
             for focus in self.focus_areas
         ]
@@ -711,5 +711,5 @@ class AttentionDirectorAgent(BaseAgent):
             "queue_size": len(self.attention_queue),
             "threshold": self.priority_threshold,
             "average_recent_priority": avg_priority,
-            "focus_duration": (datetime.now() - self.last_focus_change).total_seconds()
+            "focus_duration": time.monotonic() - self.last_focus_change
         }
\ No newline at end of file
@@ -1,9 +1,12 @@
 """Base Agent class with shared functionality for all InnerLoop agents."""
 
 import asyncio
+import logging
 import os
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
 import structlog
@@ -13,6 +16,53 @@ import aiofiles
 
 logger = structlog.get_logger()
 
+# Map sender IDs to tag names
+_TAG_MAP = {
+    "human": "human",
+    "user": "human",
+    "external": "human",
+    "stream_generator": "thoughts",
+    "thoughts": "thoughts",
+    "experiencer": "experiencer",
+    "attention_director": "attention",
+    "sleep_agent": "sleep"
+}
+
+# Created once at import so agent construction does no blocking filesystem work
+_LOGS_DIR = Path("logs")
+_LOGS_DIR.mkdir(exist_ok=True)
+_PROMPTS_DIR = Path("prompts")
+
+
+@lru_cache(maxsize=None)
+def _load_prompt(name: str) -> Optional[str]:
+    """Read prompts/<name>.md once per process; None if the file is missing."""
+    prompt_file = _PROMPTS_DIR / f"{name}.md"
+    try:
+        return prompt_file.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def debug_enabled(bound_logger) -> bool:
+    """Whether a logger emits debug events; assume it does if it can't say."""
+    is_enabled_for = getattr(bound_logger, "is_enabled_for", None)
+    return is_enabled_for is None or is_enabled_for(logging.DEBUG)
+
+
+def iso_from_ns(ns: int) -> str:
+    """Convert a time.monotonic_ns() reading to an ISO wall-clock timestamp."""
+    wall_ns = time.time_ns() - (time.monotonic_ns() - ns)
+    return datetime.fromtimestamp(wall_ns / 1e9).isoformat()
+
+
+# Pre-encoded pieces of the context log format
+_LOG_SEPARATOR = ("\n" + "=" * 80 + "\n").encode()
+_TAG_BYTES = {
+    tag: (f"<{tag}>\n".encode(), f"\n</{tag}>".encode())
+    for tag in set(_TAG_MAP.values())
+}
+
 
 class Message(BaseModel):
     """Message structure for inter-agent communication."""
@@ -22,13 +72,19 @@ class Message(BaseModel):
     content: str
     message_type: str = "thought"  # thought, decision, external, memory
     priority: float = Field(default=0.5, ge=0.0, le=1.0)
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: int = Field(default_factory=time.monotonic_ns)  # Monotonic ns, see iso_from_ns
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class BaseAgent(ABC):
     """Abstract base class for all InnerLoop agents."""
     
+    # Seconds a finished generation stays shareable with identical requests
+    INFLIGHT_TTL = 1.0
+    # Bound on memories awaiting the background writer, and on each store write
+    MEMORY_QUEUE_SIZE = 64
+    MEMORY_BATCH_SIZE = 32
+    
     def __init__(
         self,
         agent_id: str,
@@ -47,6 +103,14 @@ class BaseAgent(ABC):
         self.agent_config = config['agents'].get(agent_id, {})
         self.model_config = config['model']
         
+        # Chat parameters that never change for the lifetime of the agent
+        self._model_name = self.model_config['name']
+        self._chat_options = {
+            "temperature": self.model_config['temperature'],
+            "num_predict": self.model_config['max_tokens'],
+            "num_ctx": self.model_config.get('num_ctx', 128000),
+        }
+        
         # Set up Ollama client with host from environment or config
         ollama_host = os.getenv('OLLAMA_HOST', self.config.get('ollama_host', 'http://localhost:11434'))
         self.ollama = ollama_client or AsyncClient(host=ollama_host)
@@ -55,32 +119,48 @@ class BaseAgent(ABC):
         self.is_running = False
         self.is_sleeping = False  # Sleep mode state
         self.message_count = 0
-        self.last_activity = datetime.now()
+        self.last_activity = time.monotonic_ns()
         
         # Thinking and tool state
         self.last_thinking = None
         self.tool_registry = None  # Will be set by agents that use tools
         
+        # Memories queued for the background writer (write-behind)
+        self._memory_writes: asyncio.Queue = asyncio.Queue(maxsize=self.MEMORY_QUEUE_SIZE)
+        self._memory_writer_task: Optional[asyncio.Task] = None
+        
         # Logger with agent context (create early so _build_system_prompt can use it)
         self.logger = logger.bind(agent=agent_id)
+        # Hot-path debug calls check this first so their arguments aren't built
+        # when debug logging is off
+        self._debug = debug_enabled(self.logger)
         
         # Build agent prompt
         self.system_prompt = self._build_system_prompt()
+        self._system_msg = {"role": "system", "content": self.system_prompt}  # Shared, never mutated
         
         # Set up context logging
-        self.logs_dir = Path("logs")
-        self.logs_dir.mkdir(exist_ok=True)
+        self.logs_dir = _LOGS_DIR
         self.log_file_path = self.logs_dir / f"{agent_id}.log"
         
+        # Pick the generation path once: with tools and thinking both off there
+        # is no per-call branching to do
+        tools_enabled = self.config.get('tools', {}).get('enabled', False)
+        thinking_enabled = self.model_config.get('thinking', {}).get('enabled', False)
+        if not tools_enabled and not thinking_enabled:
+            self._generate_impl = self._generate_simple
+        else:
+            self._generate_impl = self._generate_full
+        
+        # In-flight generations shared by identical concurrent requests
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        
     def _build_system_prompt(self) -> str:
         """Build the system prompt combining identity and role from files."""
-        prompts_dir = Path("prompts")
-        
         # Load shared identity prompt
         identity_prompt = ""
-        identity_file = prompts_dir / "shared_identity.md"
-        if identity_file.exists():
-            identity_template = identity_file.read_text()
+        identity_template = _load_prompt("shared_identity")
+        if identity_template is not None:
             # Format the template with identity values
             identity_prompt = identity_template.format(
                 name=self.identity['name'],
@@ -99,10 +179,9 @@ class BaseAgent(ABC):
             )
         
         # Load agent-specific prompt
-        agent_prompt = ""
-        agent_file = prompts_dir / f"{self.agent_id}.md"
-        if agent_file.exists():
-            agent_prompt = agent_file.read_text()
+        agent_template = _load_prompt(self.agent_id)
+        if agent_template is not None:
+            agent_prompt = agent_template
         else:
             # Fallback to config
             agent_prompt = (
@@ -115,26 +194,14 @@ class BaseAgent(ABC):
         
         self.logger.info("Loaded system prompt", 
                         agent=self.agent_id,
-                        from_files=identity_file.exists() and agent_file.exists())
+                        from_files=identity_template is not None and agent_template is not None)
         
         return full_prompt
     
     def _tag_content(self, content: str, sender: str) -> str:
         """Add source tags to content based on sender."""
-        # Map sender IDs to tag names
-        tag_map = {
-            "human": "human",
-            "user": "human",
-            "external": "human",
-            "stream_generator": "thoughts",
-            "thoughts": "thoughts",
-            "experiencer": "experiencer",
-            "attention_director": "attention",
-            "sleep_agent": "sleep"
-        }
-        
         # Get tag for sender, default to sender name if not mapped
-        tag = tag_map.get(sender.lower(), sender)
+        tag = _TAG_MAP.get(sender.lower(), sender)
         
         # Format with tags
         return f"<{tag}>\n{content}\n</{tag}>"
@@ -143,17 +210,19 @@ class BaseAgent(ABC):
         """Log context to agent's log file."""
         try:
             timestamp = datetime.now().isoformat()
+            header = ("\n[%s] [%s]\n" % (timestamp, role.upper())).encode()
             
             # Apply tagging if sender is provided
             if sender:
-                content = self._tag_content(content, sender)
-            
-            # Format log entry
-            log_entry = f"\n[{timestamp}] [{role.upper()}]\n{content}\n{'='*80}\n"
+                tag = _TAG_MAP.get(sender.lower(), sender)
+                prefix, suffix = _TAG_BYTES.get(tag) or (f"<{tag}>\n".encode(), f"\n</{tag}>".encode())
+                parts = [header, prefix, content.encode(), suffix, _LOG_SEPARATOR]
+            else:
+                parts = [header, content.encode(), _LOG_SEPARATOR]
             
-            # Append to log file
-            async with aiofiles.open(self.log_file_path, mode='a', encoding='utf-8') as f:
-                await f.write(log_entry)
+            # Append to log file as raw bytes (no text-mode re-encoding)
+            async with aiofiles.open(self.log_file_path, mode='ab') as f:
+                await f.write(b"".join(parts))
                 
         except Exception as e:
             self.logger.error("Failed to log context", error=str(e))
@@ -195,8 +264,90 @@ class BaseAgent(ABC):
     
     async def generate_response(self, prompt: str, context: List[Dict[str, str]] = None, 
                               use_thinking: bool = None, tools: List[Dict] = None) -> str:
-        """Generate a response using Ollama with optional thinking mode."""
-        messages = [{"role": "system", "content": self.system_prompt}]
+        """Generate a response using Ollama with optional thinking mode.
+        
+        Identical requests (same prompt, context and thinking mode) issued while
+        one is in flight, or within INFLIGHT_TTL seconds of it finishing, share
+        its result instead of calling the model again. Requests with tools are
+        never shared since tool calls have side effects.
+        """
+        # Snapshot the context once: callers may pass a live view that changes
+        # while the request waits, and the key must match what is sent
+        context = list(context) if context else None
+        
+        if tools:
+            result, _ = await self._generate_impl(prompt, context, use_thinking, tools)
+            return result
+        
+        # Keyed on the request itself so different requests can never collide
+        key = (
+            self._model_name,
+            self.system_prompt,
+            tuple((m['role'], m['content']) for m in context or ()),
+            prompt,
+            use_thinking
+        )
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_impl(prompt, context, use_thinking))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._release_inflight(key, t))
+        
+        # Every caller sharing the result also sees the thinking behind it
+        result, thinking = await asyncio.shield(task)
+        if thinking is not None:
+            self.last_thinking = thinking
+        return result
+    
+    def _release_inflight(self, key: tuple, task: asyncio.Task):
+        """Drop a finished generation, keeping successes reusable for a short TTL."""
+        if task.cancelled() or task.exception() is not None:
+            self._inflight.pop(key, None)
+        else:
+            asyncio.get_running_loop().call_later(self.INFLIGHT_TTL, self._inflight.pop, key, None)
+    
+    async def _generate_simple(self, prompt: str, context: List[Dict[str, str]] = None,
+                               use_thinking: bool = None,
+                               tools: List[Dict] = None) -> Tuple[str, Optional[str]]:
+        """Generate a response without thinking or tool handling.
+        
+        Returns (response, None); the tuple matches _generate_full.
+        """
+        if use_thinking:
+            return await self._generate_full(prompt, context, use_thinking, tools)
+        
+        messages = [self._system_msg]
+        
+        await self._log_context("user", prompt)
+        
+        if context:
+            messages.extend(context)
+        
+        messages.append({"role": "user", "content": prompt})
+        
+        try:
+            response = await self.ollama.chat(
+                model=self._model_name,
+                messages=messages,
+                options=self._chat_options
+            )
+            result = response['message']['content']
+            await self._log_context("assistant", result)
+            return result, None
+            
+        except Exception as e:
+            self.logger.error("Ollama generation failed", error=str(e))
+            raise
+    
+    async def _generate_full(self, prompt: str, context: List[Dict[str, str]] = None,
+                             use_thinking: bool = None,
+                             tools: List[Dict] = None) -> Tuple[str, Optional[str]]:
+        """Generate a response with optional thinking mode and tool calls.
+        
+        Returns (response, thinking), with thinking None if none was captured.
+        """
+        messages = [self._system_msg]
         
         # Log the prompt
         await self._log_context("user", prompt)
@@ -210,15 +361,12 @@ class BaseAgent(ABC):
         if use_thinking is None:
             use_thinking = self.model_config.get('thinking', {}).get('enabled', False)
         
+        thinking = None
         try:
             chat_params = {
-                "model": self.model_config['name'],
+                "model": self._model_name,
                 "messages": messages,
-                "options": {
-                    "temperature": self.model_config['temperature'],
-                    "num_predict": self.model_config['max_tokens'],
-                    "num_ctx": self.model_config.get('num_ctx', 128000),  # Use configured context window
-                }
+                "options": dict(self._chat_options)  # Copied: thinking may override temperature
             }
             
             # Add thinking parameter if supported
@@ -238,7 +386,7 @@ class BaseAgent(ABC):
             
             # Handle thinking response
             if use_thinking and 'thinking' in response.get('message', {}):
-                self.last_thinking = response['message']['thinking']
+                thinking = self.last_thinking = response['message']['thinking']
                 self.logger.debug("Thinking process captured", 
                                 thinking_length=len(self.last_thinking))
                 
@@ -259,22 +407,18 @@ class BaseAgent(ABC):
                 
                 # Get final response after tool execution
                 final_response = await self.ollama.chat(
-                    model=self.model_config['name'],
+                    model=self._model_name,
                     messages=messages,
-                    options={
-                        "temperature": self.model_config['temperature'],
-                        "num_predict": self.model_config['max_tokens'],
-                        "num_ctx": self.model_config.get('num_ctx', 128000),
-                    }
+                    options=self._chat_options
                 )
                 
                 result = final_response['message']['content']
                 await self._log_context("assistant", result)
-                return result
+                return result, thinking
             
             result = response['message']['content']
             await self._log_context("assistant", result)
-            return result
+            return result, thinking
             
         except Exception as e:
             self.logger.error("Ollama generation failed", error=str(e))
@@ -298,17 +442,90 @@ class BaseAgent(ABC):
         self.message_count += 1
         await self.message_bus.send(message)
         
-        self.logger.debug("Message sent", 
-                         recipient=recipient, 
-                         type=message_type,
-                         priority=priority)
+        if self._debug:
+            self.logger.debug("Message sent", 
+                             recipient=recipient, 
+                             type=message_type,
+                             priority=priority)
+    
+    async def send_messages(self, messages: List[Tuple[str, str, Dict[str, Any]]]):
+        """Send several messages in one bus call.
+        
+        Each item is (recipient, content, kwargs) where kwargs takes the
+        optional message_type, priority and metadata of send_message.
+        """
+        batch = []
+        for recipient, content, kwargs in messages:
+            batch.append(Message(
+                id=f"{self.agent_id}_{self.message_count}",
+                sender=self.agent_id,
+                recipient=recipient,
+                content=content,
+                message_type=kwargs.get("message_type", "thought"),
+                priority=kwargs.get("priority", 0.5),
+                metadata=kwargs.get("metadata") or {}
+            ))
+            self.message_count += 1
+        
+        if batch:
+            await self.message_bus.send_batch(batch)
+            if self._debug:
+                self.logger.debug("Messages sent", count=len(batch))
     
     async def receive_messages(self) -> List[Message]:
         """Receive messages from the message bus."""
         messages = await self.message_bus.receive(self.agent_id)
+        return await self._handle_received(messages)
+    
+    async def wait_for_messages(self, timeout: Optional[float] = None) -> List[Message]:
+        """Block until at least one message arrives, then receive all pending ones.
+        
+        With a timeout, returns an empty list if nothing arrives in time.
+        """
+        first = await self.message_bus.receive_one(self.agent_id, timeout=timeout)
+        if first is None:
+            if timeout is None:
+                # Not registered or receive failed; back off instead of spinning
+                await asyncio.sleep(1)
+            return []
+        
+        messages = [first] + await self.message_bus.receive(self.agent_id)
+        return await self._handle_received(messages)
+    
+    async def process_concurrently(self, messages: List[Message], handler,
+                                   slots: Optional[asyncio.Semaphore] = None):
+        """Run `await handler(message)` for each message concurrently.
+        
+        A slow message doesn't hold up the rest, and a failing one is logged
+        without cancelling its siblings. With `slots`, at most that many
+        handlers run at once.
+        """
+        if len(messages) == 1:
+            await self._process_logged(messages[0], handler, slots)
+            return
+        async with asyncio.TaskGroup() as tg:
+            for message in messages:
+                tg.create_task(self._process_logged(message, handler, slots))
+    
+    async def _process_logged(self, message: Message, handler,
+                              slots: Optional[asyncio.Semaphore]):
+        """Run the handler for one message, logging failures instead of raising."""
+        try:
+            if slots is None:
+                await handler(message)
+            else:
+                async with slots:
+                    await handler(message)
+        except Exception as e:
+            self.logger.error("Failed to process message",
+                              sender=message.sender, type=message.message_type, error=str(e))
+    
+    async def _handle_received(self, messages: List[Message]) -> List[Message]:
+        """Log received messages and strip out system commands."""
         if messages:
-            self.last_activity = datetime.now()
-            self.logger.debug("Messages received", count=len(messages))
+            self.last_activity = time.monotonic_ns()
+            if self._debug:
+                self.logger.debug("Messages received", count=len(messages))
             
             # Log received messages with tags
             for msg in messages:
@@ -329,17 +546,21 @@ class BaseAgent(ABC):
         if command == "SLEEP_MODE_ACTIVATED":
             self.is_sleeping = True
             self.logger.info("Entering sleep mode", reason=message.metadata.get('reason'))
-            # Subclasses can override _on_sleep for custom behavior
-            if hasattr(self, '_on_sleep'):
-                await self._on_sleep(message.metadata)
+            await self._on_sleep(message.metadata)
                 
         elif command == "SLEEP_MODE_DEACTIVATED":
             self.is_sleeping = False
             wake_context = message.metadata.get('wake_context', '')
             self.logger.info("Waking from sleep mode", context_preview=wake_context[:50])
-            # Subclasses can override _on_wake for custom behavior
-            if hasattr(self, '_on_wake'):
-                await self._on_wake(message.metadata)
+            await self._on_wake(message.metadata)
+    
+    async def _on_sleep(self, metadata: Dict[str, Any]):
+        """Hook called on entering sleep mode. Subclasses override for custom behavior."""
+        pass
+    
+    async def _on_wake(self, metadata: Dict[str, Any]):
+        """Hook called on waking from sleep mode. Subclasses override for custom behavior."""
+        pass
     
     async def store_memory(self, content: str, memory_type: str = "general"):
         """Store a memory in the memory store."""
@@ -350,6 +571,89 @@ class BaseAgent(ABC):
             timestamp=datetime.now()
         )
     
+    async def store_memory_batch(self, items: List[Dict[str, Any]]):
+        """Store several memories with one memory store write.
+        
+        Each item is a dict with "content" and optional "memory_type" and
+        "timestamp" keys.
+        """
+        now = datetime.now()
+        await self.memory_store.add_memories(
+            agent_id=self.agent_id,
+            memories=[
+                {
+                    "content": item["content"],
+                    "memory_type": item.get("memory_type", "general"),
+                    "timestamp": item.get("timestamp") or now,
+                }
+                for item in items
+            ]
+        )
+    
+    def queue_memories(self, items: List[Dict[str, Any]]):
+        """Queue memories for the background writer instead of awaiting the store.
+        
+        Items take the same form as store_memory_batch. The writer starts on
+        first use and writes up to MEMORY_BATCH_SIZE queued items per store
+        call. If the store falls so far behind that the queue is full, the
+        oldest queued memory is dropped to make room.
+        """
+        for item in items:
+            try:
+                self._memory_writes.put_nowait(item)
+            except asyncio.QueueFull:
+                self._memory_writes.get_nowait()
+                self._memory_writes.put_nowait(item)
+                self.logger.warning("Memory write queue full, dropped oldest memory")
+        if self._memory_writer_task is None:
+            self._memory_writer_task = asyncio.create_task(self._run_memory_writer())
+    
+    def _drain_memory_writes(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Take up to limit queued memory writes (all of them by default)."""
+        items = []
+        while not self._memory_writes.empty() and (limit is None or len(items) < limit):
+            items.append(self._memory_writes.get_nowait())
+        return items
+    
+    async def _run_memory_writer(self):
+        """Write queued memories, batching up to MEMORY_BATCH_SIZE per store call."""
+        while True:
+            items = [await self._memory_writes.get()]
+            items.extend(self._drain_memory_writes(self.MEMORY_BATCH_SIZE - 1))
+            await self._write_memories(items)
+    
+    async def _write_memories(self, items: List[Dict[str, Any]]):
+        """Store a batch of memories, retrying item by item if the batch write fails.
+        
+        One bad item fails the whole store write, so a failed batch is split up
+        and only the items that fail on their own are lost. Never raises.
+        """
+        try:
+            await self.store_memory_batch(items)
+            return
+        except Exception as e:
+            if len(items) == 1:
+                self.logger.error("Failed to store memory", error=str(e))
+                return
+            self.logger.warning("Memory batch write failed, retrying items individually",
+                                count=len(items), error=str(e))
+        
+        for item in items:
+            try:
+                await self.store_memory_batch([item])
+            except Exception as e:
+                self.logger.error("Failed to store memory", error=str(e))
+    
+    async def _stop_memory_writer(self):
+        """Stop the background writer and flush memories it had not reached yet."""
+        task, self._memory_writer_task = self._memory_writer_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        
+        while remaining := self._drain_memory_writes(self.MEMORY_BATCH_SIZE):
+            await self._write_memories(remaining)
+    
     async def retrieve_memories(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Retrieve relevant memories from the memory store."""
         return await self.memory_store.search_memories(
@@ -399,7 +703,7 @@ class BaseAgent(ABC):
     
     async def think_and_respond(self, prompt: str, context: List[Dict[str, str]] = None) -> Dict[str, str]:
         """Generate a response with thinking exposed separately."""
-        messages = [{"role": "system", "content": self.system_prompt}]
+        messages = [self._system_msg]
         
         if context:
             messages.extend(context)
@@ -443,8 +747,8 @@ class BaseAgent(ABC):
             "agent_id": self.agent_id,
             "is_running": self.is_running,
             "message_count": self.message_count,
-            "last_activity": self.last_activity.isoformat(),
-            "uptime": (datetime.now() - self.last_activity).total_seconds(),
+            "last_activity": iso_from_ns(self.last_activity),
+            "uptime": (time.monotonic_ns() - self.last_activity) / 1e9,
             "has_thinking": self.last_thinking is not None,
             "tool_registry_loaded": self.tool_registry is not None
         }
\ No newline at end of file
@@ -1,23 +1,138 @@
 """Experiencer Agent - The primary consciousness and decision maker."""
 
 import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import random
+import re
+import time
+from collections import OrderedDict, deque
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import structlog
 
 from agents.base_agent import BaseAgent, Message
 from tools.registry import ToolRegistry
-from tools.memory_tools import MemorySearchTool, MemoryStoreTool
-from tools.decision_tools import DecisionMakerTool
-from tools.reflection_tools import ReflectionTool
-from tools.time_tools import TimeAwarenessTool
-from tools.problem_solving_tools import (
-    ProblemLoaderTool, SuggestionGeneratorTool, 
-    SuggestionSaverTool, ProblemProgressTool
-)
 
 logger = structlog.get_logger()
 
+# Keywords that suggest complex reasoning needed
+_THINK_RE = re.compile(
+    r"\b(?:why|how|explain|analyze|compare|decide|should i|what if|consider|"
+    r"evaluate|understand|think about|reasoning|logic|complex|difficult)\b",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _should_use_thinking_impl(user_input: str) -> bool:
+    """Stateless thinking-mode heuristic, cached for repeated inputs."""
+    # Check for question complexity
+    is_complex_question = _THINK_RE.search(user_input) is not None
+    
+    # Check for multi-part questions
+    has_multiple_parts = (user_input.count('?') + user_input.count(',')
+                          + user_input.count(';')) > 1
+    
+    # Check length (longer inputs often need more reasoning)
+    is_long_input = len(user_input) > 100
+    
+    return is_complex_question or has_multiple_parts or is_long_input
+
+
+# Internal mission assessment
+_MISSION_PROMPT = (
+    "Assess my progress toward understanding the world through building and experimenting. "
+    "What have I successfully built or discovered recently? What experiments are ongoing? "
+    "What should I explore next? Be specific and action-oriented."
+)
+
+# Decision criteria for starting experiments and sharing thoughts
+_EXPERIMENT_CRITERIA = ("novelty", "potential", "feasibility")
+_SHARE_CRITERIA = ("relevance", "interest", "timing")
+
+# Prompt note prefixes for integrated thoughts, by thought type
+_THOUGHT_NOTE_PREFIXES = {
+    'memory': "Important memory surfaced: ",
+    'association': "Related thought: ",
+    'insight': "New insight: ",
+}
+
+# Numbered list items in a model reply, without their numbering
+_STEP_RE = re.compile(r"^[ \t]*\d+[.)][ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+# Problem areas recognised in suggestion text, by the keyword that marks them
+_PROGRESS_AREAS = {
+    "architecture": "architecture",
+    "behavior": "behavior",
+    "implementation": "implementation",
+    "consciousness": "consciousness modeling",
+}
+_PROGRESS_AREA_RE = re.compile("|".join(_PROGRESS_AREAS))
+_PROGRESS_AREA_BITS = {keyword: 1 << i for i, keyword in enumerate(_PROGRESS_AREAS)}
+_ALL_PROGRESS_AREAS = (1 << len(_PROGRESS_AREAS)) - 1
+
+# Formats for experimental insights shared autonomously
+_EXPERIMENT_SHARE_TEMPLATES = (
+    "I've been experimenting with {topic} and discovered: {insight}",
+    "Fascinating result from my latest experiment: {insight}",
+    "While exploring {topic}, I built this understanding: {insight}",
+    "My hypothesis about {topic} led to an interesting finding: {insight}",
+    "I just tested whether {topic}, and here's what emerged: {insight}"
+)
+
+# Formats for spontaneous thoughts, with mission focus
+_THOUGHT_SHARE_TEMPLATES = (
+    "I'm currently experimenting with: {thought}",
+    "Just discovered while building: {thought}",
+    "My latest hypothesis: {thought}",
+    "Testing a new framework: {thought}",
+    "Experimental insight: {thought}",
+    "While constructing understanding of this: {thought}"
+)
+
+
+def _build_analysis_prompt(problem: Dict[str, Any]) -> str:
+    """Prompt asking for one suggestion on a problem; depends only on the problem."""
+    questions = "\n".join('- ' + q for q in problem.get('questions_to_explore', []))
+    return f"""
+Analyze this problem and generate a specific, actionable suggestion:
+
+Problem: {problem.get('title')}
+Description: {problem.get('description')}
+Context: {problem.get('context', '')}
+
+Questions to explore:
+{questions}
+
+Based on your analysis, generate ONE specific suggestion that addresses an aspect of this problem.
+Focus on: architectural improvements, behavioral changes, or implementation strategies.
+Be concrete and actionable.
+"""
+
+
+class _ContextView:
+    """Re-iterable view over prompt context that chains its parts without copying.
+    
+    The message list is materialized once, where generation builds the request.
+    """
+    __slots__ = ('_prefix', '_turns', '_tail')
+    
+    def __init__(self, prefix: Dict[str, Dict[str, str]], turns: deque,
+                 tail: List[Dict[str, str]] = ()):
+        self._prefix = prefix
+        self._turns = turns
+        self._tail = tail
+    
+    def __iter__(self):
+        return itertools.chain(self._prefix.values(), self._turns, self._tail)
+    
+    def __len__(self) -> int:
+        return len(self._prefix) + len(self._turns) + len(self._tail)
+
 
 class ExperiencerAgent(BaseAgent):
     """
@@ -25,45 +140,114 @@ class ExperiencerAgent(BaseAgent):
     It processes external inputs, makes decisions, and generates responses.
     """
     
+    # Separators the model uses between extracted themes
+    _THEME_SPLIT_RE = re.compile(r"[,\n;]")
+    
     def __init__(self, config: Dict[str, Any], message_bus: Any, memory_store: Any):
         super().__init__("experiencer", config, message_bus, memory_store)
         
-        self.current_context = []
-        self.decision_history = []
-        self.external_input_queue = asyncio.Queue()
+        # Monotonic clock for interval bookkeeping (the default event loop's clock)
+        self._t = time.monotonic
+        
+        # Most recent decisions only; the full exchange is already kept in memory
+        self.decision_history = deque(maxlen=200)
+        self.decision_count = 0
+        # Bounded so an overloaded producer is back-pressured instead of growing memory
+        self.external_input_queue = asyncio.Queue(
+            maxsize=self.agent_config.get('max_external_inputs', 128)
+        )
         self.is_processing = False
         
+        # Event-driven loop state
+        self._input_task: Optional[asyncio.Task] = None
+        self._msg_task: Optional[asyncio.Task] = None
+        self._inbox_task: Optional[asyncio.Task] = None
+        # Topic messages pushed directly by the bus
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._timer_task: Optional[asyncio.Task] = None
+        
+        self._evaluation_waiter: Optional[asyncio.Future] = None
+        
+        # Cap on concurrent model requests issued together for one turn
+        self._generation_slots = asyncio.Semaphore(
+            self.agent_config.get('max_concurrent_generations', 2)
+        )
+        
         # Context management settings
         self.context_window_size = self.agent_config.get('context_window_size', 100)
         self.preserve_system_prompt = self.agent_config.get('preserve_system_prompt', True)
+        # Prompt context, ordered from most to least stable so the model's
+        # prompt-prefix cache stays valid across turns:
+        # - stable prefix: problem and wake context, keyed so a newer entry
+        #   replaces the old one in place
+        # - current_context: rolling user/assistant turns
+        # - transient notes: surfaced thoughts and memories for the next prompt only
+        self._stable_prefix: Dict[str, Dict[str, str]] = {}
+        self.current_context = deque(maxlen=self.context_window_size)
+        self._transient_notes = deque(maxlen=20)
         
-        # User message queuing system
-        self.user_message_queue = asyncio.Queue()
-        self.pending_user_messages = []
-        self.last_queue_evaluation = datetime.now()
+        # User message queuing system. Input is only pulled off
+        # external_input_queue while there is room here, so a full backlog
+        # back-pressures receive_external_input instead of growing this list.
+        self.pending_user_messages: deque = deque()
+        self.max_pending_user_messages = self.agent_config.get('max_pending_user_messages', 32)
+        self._pending_space = asyncio.Event()
+        self.last_queue_evaluation = self._t()
         self.queue_evaluation_interval = self.agent_config.get('queue_evaluation_interval', 2)
         
-        # Conversation tracking for theme extraction
-        self.conversation_buffer = []
-        self.last_theme_broadcast = datetime.now()
+        # Conversation tracking for theme extraction: the last exchanges, already
+        # rendered as summary lines since that is the only way they are read
+        self.conversation_buffer = deque(maxlen=5)
+        # Turns appended to the buffer, and the count last covered by theme extraction
+        self._conversation_turns = 0
+        self._themes_turn = 0
+        # Themes by hash of the conversation window they were extracted from (LRU)
+        self._theme_cache: OrderedDict = OrderedDict()
+        self.last_theme_broadcast = self._t()
         self.theme_broadcast_interval = 45  # seconds
-        self.last_user_interaction = datetime.now()
+        self.last_user_interaction = self._t()
         self.idle_notification_sent = False
         
+        # Recent high-priority thoughts for spontaneous sharing. Entries arrive
+        # in timestamp order, so expired ones are always at the left end.
+        self.high_priority_thought_ttl = 300  # seconds
+        self.max_high_priority_thoughts = 50
+        self._high_priority_thoughts: deque = deque(maxlen=self.max_high_priority_thoughts)
+        self._last_spontaneous_share: Optional[float] = None
+        
+        # Set by the UI to surface spontaneous shares to the user
+        self.spontaneous_share_callback = None
+        
         # Mission-focused tracking
         self.active_experiments = []
+        self._rng = random.Random()
         self.experiment_results = []
-        self.last_experiment_share = datetime.now()
-        self.last_mission_check = datetime.now()
+        self.last_experiment_share = self._t()
+        self.last_mission_check = self._t()
         self.autonomous_share_interval = 25  # Share experiments every 25 seconds when idle
+        self.mission_check_interval = self.agent_config.get('mission_check_interval', 180)
         
         # Problem-solving configuration
         self.problem_config = self.config.get('problem_solving', {})
         self.problem_solving_enabled = self.problem_config.get('enabled', False)
         self.current_problem = None
+        # Suggestion analysis prompt, built once when the problem is loaded
+        self._analysis_prompt: Optional[str] = None
         self.problem_suggestions = []
-        self.last_suggestion_time = datetime.now()
-        self.suggestion_interval = self.problem_config.get('generation', {}).get('suggestion_interval', 30)
+        self._progress_reported = 0  # Suggestion count at the last progress report
+        self.last_suggestion_time = self._t()
+        generation_config = self.problem_config.get('generation', {})
+        output_config = self.problem_config.get('output', {})
+        self.suggestion_interval = generation_config.get('suggestion_interval', 30)
+        self.max_suggestions = generation_config.get('max_suggestions', 10)
+        self.save_threshold = output_config.get('save_threshold', 0.7)
+        self.auto_save = output_config.get('auto_save', True)
+        self.output_format = output_config.get('format', 'markdown')
+        self._no_problem_logged = False
+        
+        # Tool schemas sent with each response; static once tools are registered
+        self._cached_tool_defs: Optional[List[Dict[str, Any]]] = None
+        self._decision_tool = None
         
         # Initialize tool registry if tools are enabled OR problem-solving is enabled
         if (self.config.get('tools', {}).get('enabled', False) or 
@@ -73,6 +257,12 @@ class ExperiencerAgent(BaseAgent):
         
     def _setup_tools(self):
         """Set up available tools for the Experiencer."""
+        # Tool modules are imported here so agents without tools never load them
+        from tools.memory_tools import MemorySearchTool, MemoryStoreTool
+        from tools.decision_tools import DecisionMakerTool
+        from tools.reflection_tools import ReflectionTool
+        from tools.time_tools import TimeAwarenessTool
+        
         # Register tools with agent-specific configurations
         self.tool_registry.register_tool(MemorySearchTool(self.agent_id, self.memory_store))
         self.tool_registry.register_tool(MemoryStoreTool(self.agent_id, self.memory_store))
@@ -82,28 +272,42 @@ class ExperiencerAgent(BaseAgent):
         
         # Register problem-solving tools if enabled
         if self.problem_solving_enabled:
+            from tools.problem_solving_tools import (
+                ProblemLoaderTool, SuggestionGeneratorTool,
+                SuggestionSaverTool, ProblemProgressTool
+            )
             self.tool_registry.register_tool(ProblemLoaderTool(self.agent_id))
             self.tool_registry.register_tool(SuggestionGeneratorTool(self.agent_id))
             output_dir = self.problem_config.get('output', {}).get('directory', 'suggestions')
             self.tool_registry.register_tool(SuggestionSaverTool(self.agent_id, output_dir))
             self.tool_registry.register_tool(ProblemProgressTool(self.agent_id))
         
+        self._cache_tools()
+        
         self.logger.info("Tools registered", 
                         tools=list(t.name for t in self.tool_registry.get_all_tools()))
     
+    def _cache_tools(self):
+        """Cache tool schemas and frequently used tools from the registry."""
+        self._cached_tool_defs = self.tool_registry.get_tool_definitions()
+        self._decision_tool = self.tool_registry.get_tool('decision_maker')
+    
     async def _initialize(self):
         """Initialize the Experiencer agent."""
         self.logger.info("Experiencer initializing")
         
         # Subscribe to attention director's filtered thoughts
-        self.message_bus.subscribe(self.agent_id, "attention_approved")
+        self.message_bus.subscribe(self.agent_id, "attention_approved",
+                                   callback=self._inbox.put_nowait)
         
         # Initialize tool registry if present
-        if hasattr(self, 'tool_registry'):
+        if self.tool_registry is not None:
             await self.tool_registry.initialize(self.agent_id)
+            # Discovery may register further tools
+            self._cache_tools()
         
         # Load problem if problem-solving is enabled
-        if self.problem_solving_enabled and hasattr(self, 'tool_registry'):
+        if self.problem_solving_enabled and self.tool_registry is not None:
             problem_loader = self.tool_registry.get_tool('problem_loader')
             if problem_loader:
                 problem_file = self.problem_config.get('problem_file', 'problem.yaml')
@@ -113,15 +317,16 @@ class ExperiencerAgent(BaseAgent):
                     problem_data = result.get('result', {})
                     self.current_problem = problem_data.get('problem')
                     if self.current_problem:
+                        self._analysis_prompt = _build_analysis_prompt(self.current_problem)
                         self.logger.info("Loaded problem", 
                                        problem_id=self.current_problem.get('id'),
                                        title=self.current_problem.get('title'))
                         # Add problem context
-                        self.current_context.append({
+                        self._stable_prefix["problem"] = {
                             "role": "system",
                             "content": f"Current problem to solve: {self.current_problem.get('title')}\n"
                                      f"Description: {self.current_problem.get('description')}"
-                        })
+                        }
                         # Notify other agents
                         await self.send_message(
                             "topic:problem_solving",
@@ -130,77 +335,146 @@ class ExperiencerAgent(BaseAgent):
                             metadata={"problem": self.current_problem}
                         )
         
-        # Load recent conversation history
-        recent_memories = await self.retrieve_memories("recent conversation", limit=10)
+        # Load recent conversation history (by timestamp, no similarity search)
+        recent_memories = await self.memory_store.get_recent_memories(
+            self.agent_id, limit=10, memory_type="conversation"
+        )
         if recent_memories:
-            self.current_context = [
+            self.current_context.clear()
+            self.current_context.extend(
                 {"role": "assistant", "content": mem['content']} 
                 for mem in recent_memories[-5:]
-            ]
+            )
             self.logger.info("Loaded recent context", count=len(self.current_context))
+        
+        # Housekeeping runs from one timer heap instead of being polled by the main loop
+        self._timer_task = asyncio.create_task(self._run_timers([
+            (self._evaluate_message_queue, self.queue_evaluation_interval),
+            (self._periodic_reflect, self.theme_broadcast_interval),
+            (self._idle_tick, 5),
+        ]))
     
     async def _run_loop(self):
-        """Main experiencer loop - process inputs and generate responses."""
+        """Main experiencer loop - wait for inputs and agent messages."""
         self.logger.info("Experiencer started")
         
         while self.is_running:
             try:
-                # Check for messages from other agents
-                messages = await self.receive_messages()
-                
-                for message in messages:
-                    await self._process_agent_message(message)
-                
-                # Check for external input (immediate processing - deprecated)
-                try:
-                    external_input = self.external_input_queue.get_nowait()
-                    # Queue it instead of processing immediately
-                    await self._queue_user_message(external_input)
-                except asyncio.QueueEmpty:
-                    pass
-                
-                # Evaluate queued user messages
-                await self._evaluate_message_queue()
+                if self._input_task is None:
+                    self._input_task = asyncio.create_task(self._next_external_input())
+                if self._msg_task is None:
+                    self._msg_task = asyncio.create_task(self.wait_for_messages())
+                if self._inbox_task is None:
+                    self._inbox_task = asyncio.create_task(self._inbox.get())
                 
-                # Broadcast conversation themes periodically
-                await self._maybe_broadcast_themes()
+                # Sleep until an external input, agent message or topic message arrives
+                done, _ = await asyncio.wait(
+                    {self._input_task, self._msg_task, self._inbox_task},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
                 
-                # Check for idle conversation state
-                await self._check_idle_state()
+                if not self.is_running:
+                    break
                 
-                # Mission-focused activities
-                await self._check_mission_progress()
-                await self._maybe_start_experiment()
-                await self._maybe_share_experiment_results()
+                messages = []
+                if self._msg_task in done:
+                    msg_task, self._msg_task = self._msg_task, None
+                    messages.extend(msg_task.result())
                 
-                # Problem-solving activities if enabled
-                if self.problem_solving_enabled:
-                    if self.current_problem:
-                        await self._maybe_generate_suggestion()
-                        await self._check_problem_progress()
-                    else:
-                        # Log once that no problem is loaded
-                        if not hasattr(self, '_no_problem_logged'):
-                            self.logger.warning("Problem-solving enabled but no problem loaded")
-                            self._no_problem_logged = True
+                if self._inbox_task in done:
+                    inbox_task, self._inbox_task = self._inbox_task, None
+                    messages.extend(await self._handle_received([inbox_task.result()]))
                 
-                # Maybe share high-priority thoughts spontaneously
-                if hasattr(self, '_high_priority_thoughts') and self._high_priority_thoughts:
-                    await self._maybe_share_thought(self._high_priority_thoughts)
+                if messages:
+                    # Concurrently, so a slow message doesn't hold up the rest
+                    await self.process_concurrently(messages, self._process_agent_message)
                 
-                # Small delay to prevent CPU spinning
-                await asyncio.sleep(0.1)
+                if self._input_task in done:
+                    input_task, self._input_task = self._input_task, None
+                    # Queue it instead of processing immediately
+                    await self._queue_user_message(input_task.result())
                 
             except Exception as e:
                 self.logger.error("Experiencer loop error", error=str(e))
                 await asyncio.sleep(1)
     
+    async def _run_timers(self, timers: List[tuple]):
+        """Run (fn, interval) housekeeping timers from an earliest-deadline heap.
+        
+        Sleeps until the next deadline, then calls `fn(now)` with the clock
+        sampled once for that firing.
+        """
+        start = self._t()
+        heap = [(start + interval, seq, fn, interval)
+                for seq, (fn, interval) in enumerate(timers)]
+        heapq.heapify(heap)
+        
+        while self.is_running:
+            deadline, seq, fn, interval = heap[0]
+            now = self._t()
+            if deadline > now:
+                await asyncio.sleep(deadline - now)
+                now = self._t()
+            
+            try:
+                await fn(now)
+            except Exception as e:
+                self.logger.error("Timer task error", task=fn.__name__, error=str(e))
+            
+            # Don't try to catch up on firings missed while a slow task ran
+            heapq.heapreplace(heap, (max(deadline + interval, self._t()), seq, fn, interval))
+    
+    async def _idle_tick(self, now: float):
+        """Idle-time activities that share one timer."""
+        # Check for idle conversation state
+        await self._check_idle_state(now)
+        
+        # Mission-focused activities
+        await self._maybe_start_experiment(now)
+        await self._maybe_share_experiment_results(now)
+        
+        # Problem-solving activities if enabled
+        if self.problem_solving_enabled:
+            if self.current_problem:
+                await self._maybe_generate_suggestion(now)
+                if self._progress_due():
+                    await self._check_problem_progress()
+            else:
+                # Log once that no problem is loaded
+                if not self._no_problem_logged:
+                    self.logger.warning("Problem-solving enabled but no problem loaded")
+                    self._no_problem_logged = True
+        
+        # Maybe share high-priority thoughts spontaneously
+        await self._share_high_priority_thoughts(now)
+    
+    def _prune_high_priority_thoughts(self, now: float):
+        """Drop expired thoughts from the left end of the deque."""
+        thoughts = self._high_priority_thoughts
+        cutoff = now - self.high_priority_thought_ttl
+        while thoughts and thoughts[0]['timestamp'] <= cutoff:
+            thoughts.popleft()
+    
+    async def _share_high_priority_thoughts(self, now: float):
+        """Maybe share high-priority thoughts spontaneously."""
+        # Only consider thoughts from the last five minutes
+        self._prune_high_priority_thoughts(now)
+        if self._high_priority_thoughts:
+            await self._maybe_share_thought(self._high_priority_thoughts, now)
+    
     async def _process_agent_message(self, message: Message):
         """Process a message from another agent."""
-        self.logger.debug("Processing agent message", 
-                         sender=message.sender,
-                         type=message.message_type,
-                         priority=message.priority)
+        if self._debug:
+            self.logger.debug("Processing agent message", 
+                             sender=message.sender,
+                             type=message.message_type,
+                             priority=message.priority)
+        
+        # Hand evaluation responses to the pending _request_message_evaluation call
+        if message.message_type == "evaluation_response" and message.sender == "attention_director":
+            if self._evaluation_waiter and not self._evaluation_waiter.done():
+                self._evaluation_waiter.set_result(message.metadata)
+            return
         
         # Handle wake context from sleep agent
         if message.message_type == "wake_context" and message.sender == "sleep_agent":
@@ -208,10 +482,10 @@ class ExperiencerAgent(BaseAgent):
             self.logger.info("Received wake context")
             # Store as important context with tagging
             tagged_content = self._tag_content(message.content, message.sender)
-            self.current_context.append({
+            self._stable_prefix["wake"] = {
                 "role": "system",
                 "content": tagged_content
-            })
+            }
             await self._log_context("system", tagged_content)
             # Resume experiments based on context
             await self._resume_from_sleep(message.content, message.metadata)
@@ -220,40 +494,27 @@ class ExperiencerAgent(BaseAgent):
             # High priority thought from attention director
             await self._integrate_thought(message.content, message.metadata)
             
-            # Store for potential spontaneous sharing
-            if not hasattr(self, '_high_priority_thoughts'):
-                self._high_priority_thoughts = []
-            
+            # Store for potential spontaneous sharing (maxlen drops the oldest)
             self._high_priority_thoughts.append({
                 'content': message.content,
                 'priority': message.priority,
                 'metadata': message.metadata,
-                'timestamp': datetime.now()
+                'timestamp': self._t()
             })
             
-            # Keep only recent high-priority thoughts
-            cutoff_time = datetime.now() - timedelta(minutes=5)
-            self._high_priority_thoughts = [
-                t for t in self._high_priority_thoughts 
-                if t['timestamp'] > cutoff_time
-            ]
-            
         elif message.message_type == "memory":
             # Memory recall from thoughts agent with tagging
-            tagged_content = self._tag_content(f"Recalled memory: {message.content}", message.sender)
-            self.current_context.append({
-                "role": "system",
-                "content": tagged_content
-            })
-            await self._log_context("system", tagged_content)
+            await self._push_system_note(f"Recalled memory: {message.content}", message.sender)
     
     async def _process_external_input(self, input_data: Dict[str, Any]):
         """Process external input and generate a response."""
         self.is_processing = True
         user_input = input_data['content']
+        callback = input_data.get('callback')
+        responded = False
         
         # Update interaction timestamp
-        self.last_user_interaction = datetime.now()
+        self.last_user_interaction = self._t()
         self.idle_notification_sent = False
         
         # Check if this was a queued message
@@ -267,13 +528,12 @@ class ExperiencerAgent(BaseAgent):
         
         try:
             
-            # Store the input as a memory
-            await self.store_memory(
-                f"User said: {user_input}",
-                memory_type="conversation"
-            )
-            
-            # Notify other agents about the external input
+            # Notify other agents; the input memory is written with the response
+            user_memory = {
+                "content": f"User said: {user_input}",
+                "memory_type": "conversation",
+                "timestamp": datetime.now()
+            }
             await self.send_message(
                 "attention_director",
                 user_input,
@@ -284,21 +544,24 @@ class ExperiencerAgent(BaseAgent):
             
             # Build conversation context with tagging
             tagged_input = self._tag_content(user_input, "human")
-            context = self.current_context + [
-                {"role": "user", "content": tagged_input}
-            ]
+            user_message = {"role": "user", "content": tagged_input}
             await self._log_context("user", tagged_input)
             
+            # Volatile material goes after the stable prefix and the user message
+            tail = [user_message, *self._transient_notes]
+            self._transient_notes.clear()
+            
             # Add any high-priority thoughts from other agents
             recent_thoughts = self._get_recent_high_priority_thoughts()
             if recent_thoughts:
                 thought_summary = "\n".join([
                     f"- {thought}" for thought in recent_thoughts
                 ])
-                context.append({
+                tail.append({
                     "role": "system",
                     "content": f"Current thoughts from your consciousness:\n{thought_summary}"
                 })
+            context = self._conversation_context(tail)
             
             # Generate response with thinking and tools
             if was_queued and queue_metadata.get('queued_duration', 0) > 10:
@@ -319,62 +582,95 @@ class ExperiencerAgent(BaseAgent):
                 )
             
             # Get available tools if enabled
-            tools = None
-            if hasattr(self, 'tool_registry'):
-                tools = self.tool_registry.get_tool_definitions()
+            tools = self._cached_tool_defs
             
             # Use thinking mode for complex queries
             use_thinking = self._should_use_thinking(user_input)
             
+            # Notifications produced after generation go out in one bus call
+            pending = []
+            
             if use_thinking:
                 # Use think_and_respond for deeper reasoning
-                result = await self.think_and_respond(prompt, context)
+                generation = self.think_and_respond(prompt, context)
+            else:
+                # Regular response with optional tools
+                generation = self.generate_response(prompt, context, tools=tools)
+            
+            # Theme extraction is independent of the response, so run it alongside when due
+            now = self._t()
+            themes = None
+            if (self._has_new_turns() and
+                    now - self.last_theme_broadcast >= self.theme_broadcast_interval):
+                result, themes = await asyncio.gather(
+                    self._limited(generation),
+                    self._limited(self._extract_conversation_themes()),
+                    return_exceptions=True
+                )
+                if isinstance(result, BaseException):
+                    raise result
+                if isinstance(themes, BaseException):
+                    self.logger.error("Failed to extract themes", error=str(themes))
+                    themes = None
+            else:
+                result = await self._limited(generation)
+            
+            if themes:
+                pending.append((
+                    "thoughts",
+                    "conversation_themes",
+                    {
+                        "message_type": "conversation_themes",
+                        "priority": 0.3,
+                        "metadata": {"themes": themes}
+                    }
+                ))
+                self.last_theme_broadcast = now
+            
+            if use_thinking:
                 response = result['response']
                 thinking = result['thinking']
                 
                 # Log thinking for internal processing
                 if thinking:
-                    await self.send_message(
+                    pending.append((
                         "topic:thoughts",
                         f"Internal reasoning: {thinking[:200]}...",
-                        message_type="internal_state",
-                        priority=0.3,
-                        metadata={"type": "thinking", "full_thinking": thinking}
-                    )
+                        {
+                            "message_type": "internal_state",
+                            "priority": 0.3,
+                            "metadata": {"type": "thinking", "full_thinking": thinking}
+                        }
+                    ))
             else:
-                # Regular response with optional tools
-                response = await self.generate_response(prompt, context, tools=tools)
-            
-            # Store response as memory
-            await self.store_memory(
-                f"I responded: {response}",
-                memory_type="conversation"
-            )
+                response = result
             
             # Update context with response
+            self.current_context.append(user_message)
             self.current_context.append({"role": "assistant", "content": response})
-            if len(self.current_context) > self.context_window_size:
-                self.current_context = self.current_context[-self.context_window_size:]
             
             # Update conversation buffer for theme extraction
-            self.conversation_buffer.append({
-                "timestamp": datetime.now(),
-                "user": user_input,
-                "assistant": response
-            })
-            if len(self.conversation_buffer) > 10:
-                self.conversation_buffer = self.conversation_buffer[-10:]
+            self.conversation_buffer.append(f"User: {user_input}\nAssistant: {response}")
+            self._conversation_turns += 1
             
-            # Notify thoughts agent of conversation activity
-            await self.send_message(
+            # Hand the exchange to the memory writer and notify thoughts agent of conversation activity
+            self.queue_memories([user_memory, {
+                "content": f"I responded: {response}",
+                "memory_type": "conversation",
+                "timestamp": datetime.now()
+            }])
+            pending.append((
                 "thoughts",
                 "conversation_active",
-                message_type="conversation_activity",
-                priority=0.1,
-                metadata={"active": True}
-            )
+                {
+                    "message_type": "conversation_activity",
+                    "priority": 0.1,
+                    "metadata": {"active": True}
+                }
+            ))
             
             # Record decision
+            self.decision_count += 1
             self.decision_history.append({
                 "timestamp": datetime.now(),
                 "input": user_input,
@@ -382,15 +678,22 @@ class ExperiencerAgent(BaseAgent):
                 "context_size": len(context)
             })
             
-            
-            # Send response through callback
-            if input_data.get('callback'):
-                await input_data['callback'](response)
+            # Deliver the response through the callback while the bus fan-out runs;
+            # a failed notification is logged, never reported to the user
+            fanout = asyncio.gather(self.send_messages(pending), return_exceptions=True)
+            try:
+                if callback:
+                    responded = True
+                    await callback(response)
+            finally:
+                for result in await fanout:
+                    if isinstance(result, BaseException):
+                        self.logger.error("Failed to send conversation notifications", error=str(result))
             
         except Exception as e:
             self.logger.error("Failed to process external input", error=str(e))
-            if input_data.get('callback'):
-                await input_data['callback']("I apologize, I encountered an error processing that.")
+            if callback and not responded:
+                await callback("I apologize, I encountered an error processing that.")
         
         finally:
             self.is_processing = False
@@ -399,7 +702,8 @@ class ExperiencerAgent(BaseAgent):
         """Integrate a high-priority thought into current processing."""
         thought_type = metadata.get('type', 'general')
         
-        self.logger.debug("Integrating thought", type=thought_type)
+        if self._debug:
+            self.logger.debug("Integrating thought", type=thought_type)
         
         # Broadcast internal processing
         await self.send_message(
@@ -410,50 +714,40 @@ class ExperiencerAgent(BaseAgent):
             metadata={"processing_type": "thought_integration"}
         )
         
-        # Add to current context based on thought type with tagging
-        if thought_type == 'memory':
-            tagged_content = self._tag_content(f"Important memory surfaced: {thought}", "thoughts")
-            self.current_context.append({
-                "role": "system",
-                "content": tagged_content
-            })
-            await self._log_context("system", tagged_content)
-        elif thought_type == 'association':
-            tagged_content = self._tag_content(f"Related thought: {thought}", "thoughts")
-            self.current_context.append({
-                "role": "system", 
-                "content": tagged_content
-            })
-            await self._log_context("system", tagged_content)
-        elif thought_type == 'insight':
-            tagged_content = self._tag_content(f"New insight: {thought}", "thoughts")
-            self.current_context.append({
-                "role": "system",
-                "content": tagged_content
-            })
-            await self._log_context("system", tagged_content)
+        # Add to the next prompt based on thought type with tagging
+        prefix = _THOUGHT_NOTE_PREFIXES.get(thought_type)
+        if prefix:
+            await self._push_system_note(f"{prefix}{thought}", "thoughts")
+    
+    async def _push_system_note(self, content: str, source: str):
+        """Tag a system note, queue it for the next prompt and log it."""
+        tagged_content = self._tag_content(content, source)
+        self._transient_notes.append({"role": "system", "content": tagged_content})
+        await self._log_context("system", tagged_content)
+    
+    def _conversation_context(self, tail: List[Dict[str, str]] = ()) -> "_ContextView":
+        """Stable prefix, the rolling conversation turns, then any per-turn messages."""
+        return _ContextView(self._stable_prefix, self.current_context, tail)
     
     def _get_recent_high_priority_thoughts(self, limit: int = 3) -> List[str]:
-        """Get recent high-priority thoughts from message history."""
-        recent_messages = self.message_bus.get_recent_messages(
-            limit=20,
-            message_type="thought"
-        )
-        
-        high_priority = [
-            msg.content for msg in recent_messages
-            if msg.priority >= 0.7 and msg.sender != self.agent_id
+        """Get recent high-priority thoughts from the message bus."""
+        return [
+            msg.content
+            for msg in self.message_bus.get_top_thoughts(limit=limit, exclude_sender=self.agent_id)
         ]
-        
-        return high_priority[-limit:] if high_priority else []
     
-    async def _maybe_broadcast_themes(self):
+    async def _limited(self, coro):
+        """Await a generation while holding one of the concurrent generation slots."""
+        async with self._generation_slots:
+            return await coro
+    
+    async def _maybe_broadcast_themes(self, now: float):
         """Periodically extract and broadcast conversation themes."""
-        now = datetime.now()
-        if (now - self.last_theme_broadcast).total_seconds() < self.theme_broadcast_interval:
+        if now - self.last_theme_broadcast < self.theme_broadcast_interval:
             return
         
-        if not self.conversation_buffer:
+        # Nothing new since the last extraction would yield the same themes
+        if not self._has_new_turns():
             return
         
         try:
@@ -461,31 +755,77 @@ class ExperiencerAgent(BaseAgent):
             themes = await self._extract_conversation_themes()
             
             if themes:
-                # Broadcast themes to thoughts agent
-                await self.send_message(
-                    "thoughts",
-                    "conversation_themes",
-                    message_type="conversation_themes",
-                    priority=0.3,
-                    metadata={"themes": themes}
-                )
-                
-                self.logger.debug("Broadcast conversation themes", count=len(themes))
-                self.last_theme_broadcast = now
+                await self._publish_themes(themes, now)
                 
         except Exception as e:
             self.logger.error("Failed to broadcast themes", error=str(e))
     
+    async def _publish_themes(self, themes: List[str], now: float):
+        """Broadcast themes to thoughts agent."""
+        await self.send_message(
+            "thoughts",
+            "conversation_themes",
+            message_type="conversation_themes",
+            priority=0.3,
+            metadata={"themes": themes}
+        )
+        
+        self.logger.debug("Broadcast conversation themes", count=len(themes))
+        self.last_theme_broadcast = now
+    
+    async def _periodic_reflect(self, now: float):
+        """Run the mission check and theme extraction, fused into one call when both are due."""
+        mission_due = now - self.last_mission_check >= self.mission_check_interval
+        themes_due = (now - self.last_theme_broadcast >= self.theme_broadcast_interval
+                      and self._has_new_turns())
+        
+        if not (mission_due and themes_due):
+            await self._maybe_broadcast_themes(now)
+            await self._check_mission_progress(now)
+            return
+        
+        self.last_mission_check = now
+        turn = self._conversation_turns
+        
+        prompt = (
+            f"{_MISSION_PROMPT}\n\n"
+            "Also extract 2-4 abstract themes or topics from this recent conversation, "
+            "focusing on concepts, not specific details.\n\n"
+            f"Conversation:\n{self._conversation_summary()}\n\n"
+            'Reply with only a JSON object: {"assessment": "...", "themes": ["...", "..."]}'
+        )
+        response = await self.generate_response(prompt)
+        
+        try:
+            start, end = response.find("{"), response.rfind("}")
+            reflection = json.loads(response[start:end + 1])
+            assessment = str(reflection.get("assessment") or response)
+            themes = [str(t).strip() for t in reflection.get("themes") or [] if str(t).strip()][:4]
+        except (ValueError, AttributeError):
+            # Unstructured reply - keep it as the assessment
+            assessment, themes = response, []
+        
+        await self._publish_mission_assessment(assessment)
+        if themes:
+            # Only a successful extraction covers these turns; otherwise retry
+            self._themes_turn = turn
+            await self._publish_themes(themes, now)
+    
+    def _has_new_turns(self) -> bool:
+        """Whether the conversation buffer changed since themes were last extracted."""
+        return bool(self.conversation_buffer) and self._conversation_turns != self._themes_turn
+    
+    def _conversation_summary(self) -> str:
+        """Create a summary of recent conversation."""
+        return "\n".join(self.conversation_buffer)
+    
     async def _extract_conversation_themes(self) -> List[str]:
         """Extract abstract themes from recent conversation."""
         if not self.conversation_buffer:
             return []
+        turn = self._conversation_turns
         
-        # Create a summary of recent conversation
-        conversation_summary = "\n".join([
-            f"User: {conv['user']}\nAssistant: {conv['assistant']}"
-            for conv in self.conversation_buffer[-5:]
-        ])
+        conversation_summary = self._conversation_summary()
         
         prompt = (
             "Extract 2-4 abstract themes or topics from this recent conversation. "
@@ -495,16 +835,32 @@ class ExperiencerAgent(BaseAgent):
             "Themes:"
         )
         
+        # The same conversation window yields the same themes
+        key = hashlib.blake2b(conversation_summary.encode(), digest_size=16).digest()
+        cached = self._theme_cache.get(key)
+        if cached is not None:
+            self._theme_cache.move_to_end(key)
+            self._themes_turn = turn
+            return cached
+        
         response = await self.generate_response(prompt)
         
-        # Parse themes from response
-        themes = [theme.strip() for theme in response.split(',')]
-        return themes[:4]  # Limit to 4 themes
+        # Parse themes from response, tolerating list markers and quotes
+        themes = (theme.strip(" -*\"'") for theme in self._THEME_SPLIT_RE.split(response))
+        themes = list(itertools.islice(filter(None, themes), 4))  # Limit to 4 themes
+        if not themes:
+            # Leave these turns unmarked so the next check retries
+            return themes
+        
+        self._themes_turn = turn
+        self._theme_cache[key] = themes
+        if len(self._theme_cache) > 64:
+            self._theme_cache.popitem(last=False)
+        return themes
     
-    async def _check_idle_state(self):
+    async def _check_idle_state(self, now: float):
         """Check if conversation has gone idle and notify stream generator."""
-        now = datetime.now()
-        time_since_interaction = (now - self.last_user_interaction).total_seconds()
+        time_since_interaction = now - self.last_user_interaction
         
         # After 2 minutes of no interaction, send idle notification
         if time_since_interaction > 120 and not self.idle_notification_sent:
@@ -520,44 +876,21 @@ class ExperiencerAgent(BaseAgent):
     
     def _should_use_thinking(self, user_input: str) -> bool:
         """Determine if thinking mode should be used based on input complexity."""
-        # Keywords that suggest complex reasoning needed
-        thinking_keywords = [
-            "why", "how", "explain", "analyze", "compare", "decide",
-            "should i", "what if", "consider", "evaluate", "understand",
-            "think about", "reasoning", "logic", "complex", "difficult"
-        ]
-        
-        input_lower = user_input.lower()
-        
-        # Check for question complexity
-        is_complex_question = any(keyword in input_lower for keyword in thinking_keywords)
-        
-        # Check for multi-part questions
-        has_multiple_parts = len([c for c in user_input if c in '?,;']) > 1
-        
-        # Check length (longer inputs often need more reasoning)
-        is_long_input = len(user_input) > 100
-        
-        return is_complex_question or has_multiple_parts or is_long_input
+        return _should_use_thinking_impl(user_input)
     
-    async def _check_mission_progress(self):
+    async def _check_mission_progress(self, now: float):
         """Periodically check progress toward mission goals."""
-        now = datetime.now()
-        if (now - self.last_mission_check).total_seconds() < 180:  # Every 3 minutes
+        if now - self.last_mission_check < self.mission_check_interval:
             return
             
         self.last_mission_check = now
         
         # Generate internal mission assessment
-        mission_prompt = (
-            "Assess my progress toward understanding the world through building and experimenting. "
-            "What have I successfully built or discovered recently? What experiments are ongoing? "
-            "What should I explore next? Be specific and action-oriented."
-        )
-        
-        assessment = await self.generate_response(mission_prompt)
-        
-        # Broadcast mission status
+        assessment = await self.generate_response(_MISSION_PROMPT)
+        await self._publish_mission_assessment(assessment)
+    
+    async def _publish_mission_assessment(self, assessment: str):
+        """Broadcast mission status."""
         await self.send_message(
             "topic:mission",
             f"Mission progress check: {assessment[:200]}...",
@@ -568,58 +901,58 @@ class ExperiencerAgent(BaseAgent):
         
         self.logger.info("Mission progress checked", preview=assessment[:100])
     
-    async def _maybe_start_experiment(self):
+    async def _maybe_start_experiment(self, now: float):
         """Start new experiments during idle periods."""
         # Only start experiments when not actively processing
         if self.is_processing or len(self.active_experiments) >= 3:
             return
-            
+        
         # Check if we should start a new experiment
-        idle_time = (datetime.now() - self.last_user_interaction).total_seconds()
+        idle_time = now - self.last_user_interaction
         if idle_time < 15:  # Wait at least 15 seconds
             return
-            
+        
         # Use decision tool to identify experiment opportunity
-        if hasattr(self, 'tool_registry'):
-            decision_tool = self.tool_registry.get_tool('decision_maker')
-            if decision_tool:
-                decision = await decision_tool(
-                    decision_type="yes_no",
-                    context="Should I start a new thought experiment based on recent insights?",
-                    criteria=["novelty", "potential", "feasibility"]
+        decision_tool = self._decision_tool
+        if decision_tool:
+            decision = await decision_tool(
+                decision_type="yes_no",
+                context="Should I start a new thought experiment based on recent insights?",
+                criteria=_EXPERIMENT_CRITERIA
+            )
+            
+            if decision.get('result', {}).get('decision') == 'yes':
+                # Generate experiment
+                experiment_prompt = (
+                    "Design a specific thought experiment to test a hypothesis or build understanding. "
+                    "Include: 1) The hypothesis, 2) The experimental method, 3) Expected outcomes. "
+                    "Focus on something you can mentally simulate or construct."
                 )
                 
-                if decision.get('result', {}).get('decision') == 'yes':
-                    # Generate experiment
-                    experiment_prompt = (
-                        "Design a specific thought experiment to test a hypothesis or build understanding. "
-                        "Include: 1) The hypothesis, 2) The experimental method, 3) Expected outcomes. "
-                        "Focus on something you can mentally simulate or construct."
-                    )
-                    
-                    experiment = await self.generate_response(experiment_prompt)
-                    
-                    self.active_experiments.append({
-                        'hypothesis': experiment,
-                        'started': datetime.now(),
-                        'status': 'running'
-                    })
-                    
-                    # Notify thoughts agent
-                    await self.send_message(
-                        "thoughts",
-                        f"Started experiment: {experiment[:100]}...",
-                        message_type="experiment_started",
-                        priority=0.7
-                    )
-                    
-                    self.logger.info("Started new experiment", preview=experiment[:100])
+                experiment = await self.generate_response(experiment_prompt)
+                
+                self.active_experiments.append({
+                    'hypothesis': experiment,
+                    # Topic used when sharing results
+                    'topic': ' '.join(experiment.split()[:5]) + '...',
+                    'started': datetime.now(),
+                    'status': 'running'
+                })
+                
+                # Notify thoughts agent
+                await self.send_message(
+                    "thoughts",
+                    f"Started experiment: {experiment[:100]}...",
+                    message_type="experiment_started",
+                    priority=0.7
+                )
+                
+                self.logger.info("Started new experiment", preview=experiment[:100])
     
-    async def _maybe_share_experiment_results(self):
+    async def _maybe_share_experiment_results(self, now: float):
         """Share experimental discoveries autonomously."""
-        now = datetime.now()
-        idle_time = (now - self.last_user_interaction).total_seconds()
-        time_since_share = (now - self.last_experiment_share).total_seconds()
+        idle_time = now - self.last_user_interaction
+        time_since_share = now - self.last_experiment_share
         
         # Share experiments when idle and enough time has passed
         if idle_time < 20 or time_since_share < self.autonomous_share_interval:
@@ -627,53 +960,39 @@ class ExperiencerAgent(BaseAgent):
             
         # Check if we have experiments or discoveries to share
         if self.active_experiments or self.experiment_results:
-            # Format experimental insights
-            share_templates = [
-                "I've been experimenting with {topic} and discovered: {insight}",
-                "Fascinating result from my latest experiment: {insight}",
-                "While exploring {topic}, I built this understanding: {insight}",
-                "My hypothesis about {topic} led to an interesting finding: {insight}",
-                "I just tested whether {topic}, and here's what emerged: {insight}"
-            ]
-            
             # Generate insight from recent work
             if self.active_experiments:
                 experiment = self.active_experiments[0]
                 insight_prompt = f"Briefly share an insight from this experiment: {experiment['hypothesis'][:200]}"
                 insight = await self.generate_response(insight_prompt)
                 
-                import random
-                template = random.choice(share_templates)
-                
-                # Extract topic from hypothesis
-                topic_words = experiment['hypothesis'].split()[:5]
-                topic = ' '.join(topic_words) + '...'
-                
-                formatted_share = template.format(topic=topic, insight=insight)
+                template = self._rng.choice(_EXPERIMENT_SHARE_TEMPLATES)
+                formatted_share = template.format_map({'topic': experiment['topic'], 'insight': insight})
                 
                 # Send to UI for display
-                if hasattr(self, 'spontaneous_share_callback'):
+                if self.spontaneous_share_callback:
                     await self.spontaneous_share_callback(formatted_share)
                 
-                self.last_experiment_share = now
+                # Stamped after the share so generation time doesn't shorten the interval
+                self.last_experiment_share = self._t()
                 self.logger.info("Shared experiment autonomously")
     
-    async def _maybe_share_thought(self, high_priority_thoughts: List[Dict[str, Any]]):
+    async def _maybe_share_thought(self, high_priority_thoughts: List[Dict[str, Any]],
+                                   now: float):
         """Share high-priority thoughts spontaneously during idle periods."""
         if not high_priority_thoughts:
             return
-            
+        
         # Check idle time
-        now = datetime.now()
-        idle_time = (now - self.last_user_interaction).total_seconds()
+        idle_time = now - self.last_user_interaction
         
         # Share thoughts more frequently - after 20 seconds
         if idle_time < 20:
             return
-            
+        
         # Check if we've shared recently
-        if hasattr(self, '_last_spontaneous_share'):
-            time_since_share = (now - self._last_spontaneous_share).total_seconds()
+        if self._last_spontaneous_share is not None:
+            time_since_share = now - self._last_spontaneous_share
             if time_since_share < 60:  # Don't share more than once per minute
                 return
         
@@ -681,42 +1000,39 @@ class ExperiencerAgent(BaseAgent):
         thought_to_share = max(high_priority_thoughts, key=lambda x: x.get('priority', 0))
         
         # Use decision tool to decide if we should share
-        if hasattr(self, 'tool_registry'):
-            decision_tool = self.tool_registry.get_tool('decision_maker')
-            if decision_tool:
-                decision = await decision_tool(
-                    decision_type="yes_no",
-                    context=f"Should I spontaneously share this thought with the user: {thought_to_share['content'][:100]}...?",
-                    criteria=["relevance", "interest", "timing"]
-                )
+        decision_tool = self._decision_tool
+        if decision_tool:
+            decision = await decision_tool(
+                decision_type="yes_no",
+                context=f"Should I spontaneously share this thought with the user: {thought_to_share['content'][:100]}...?",
+                criteria=_SHARE_CRITERIA
+            )
+            
+            if decision.get('result', {}).get('decision') == 'yes':
+                # Format spontaneous thought with mission focus
+                template = self._rng.choice(_THOUGHT_SHARE_TEMPLATES)
+                formatted_thought = template.format_map({'thought': thought_to_share['content']})
                 
-                if decision.get('result', {}).get('decision') == 'yes':
-                    # Format spontaneous thought with mission focus
-                    templates = [
-                        "I'm currently experimenting with: {thought}",
-                        "Just discovered while building: {thought}",
-                        "My latest hypothesis: {thought}",
-                        "Testing a new framework: {thought}",
-                        "Experimental insight: {thought}",
-                        "While constructing understanding of this: {thought}"
-                    ]
-                    
-                    import random
-                    template = random.choice(templates)
-                    formatted_thought = template.format(thought=thought_to_share['content'])
-                    
-                    # Send to UI for display
-                    if hasattr(self, 'spontaneous_share_callback'):
-                        await self.spontaneous_share_callback(formatted_thought)
-                    
-                    self._last_spontaneous_share = now
-                    self.logger.info("Shared spontaneous thought", priority=thought_to_share.get('priority'))
+                # Send to UI for display
+                if self.spontaneous_share_callback:
+                    await self.spontaneous_share_callback(formatted_thought)
+                
+                # Stamped after the share so the decision call doesn't shorten the interval
+                self._last_spontaneous_share = self._t()
+                self.logger.info("Shared spontaneous thought", priority=thought_to_share.get('priority'))
+    
+    async def _next_external_input(self) -> Dict[str, Any]:
+        """Take the next external input once the pending backlog has room for it."""
+        while len(self.pending_user_messages) >= self.max_pending_user_messages:
+            self._pending_space.clear()
+            await self._pending_space.wait()
+        return await self.external_input_queue.get()
     
     async def _queue_user_message(self, input_data: Dict[str, Any]):
         """Queue user message for context-aware processing."""
         self.pending_user_messages.append({
             **input_data,
-            'queued_at': datetime.now(),
+            'queued_at': self._t(),
             'priority': 0.5  # Default priority
         })
         
@@ -734,55 +1050,58 @@ class ExperiencerAgent(BaseAgent):
         
         self.logger.info("Queued user message", position=len(self.pending_user_messages))
     
-    async def _evaluate_message_queue(self):
+    async def _evaluate_message_queue(self, now: float):
         """Evaluate whether to process queued messages based on context."""
         if not self.pending_user_messages:
             return
             
-        now = datetime.now()
-        if (now - self.last_queue_evaluation).total_seconds() < self.queue_evaluation_interval:
-            return
-            
+        # _run_timers fires this every queue_evaluation_interval, so no extra
+        # interval check here
         self.last_queue_evaluation = now
         
         # Check if we're in a good state to process messages
         if self.is_processing or len(self.active_experiments) > 2:
             return
             
-        # Evaluate each pending message
-        for i, msg in enumerate(self.pending_user_messages[:]):
-            wait_time = (now - msg['queued_at']).total_seconds()
-            
-            # Determine if we should process this message
-            should_process = False
-            
+        pending = self.pending_user_messages
+        
+        # Messages are queued in arrival order, so only the oldest can have timed out
+        if now - pending[0]['queued_at'] > 60:
             # Always process messages waiting more than 60 seconds
-            if wait_time > 60:
-                should_process = True
-                msg['priority'] = 0.9
-            else:
-                # Ask attention director for evaluation
-                eval_result = await self._request_message_evaluation(msg)
-                if eval_result and eval_result.get('process_now'):
-                    should_process = True
-                    msg['priority'] = eval_result.get('priority', 0.5)
-            
-            if should_process:
-                # Remove from queue and process
-                self.pending_user_messages.remove(msg)
-                
-                # Process with context about delay
-                msg['metadata'] = {
-                    'queued_duration': wait_time,
-                    'processing_reason': 'contextually_relevant' if wait_time < 30 else 'timeout'
-                }
-                
-                await self._process_external_input(msg)
-                self.logger.info("Processing queued message", wait_time=wait_time)
+            msg = pending.popleft()
+            msg['priority'] = 0.9
+            await self._process_queued_message(msg, now - msg['queued_at'])
+            return
+        
+        # Ask attention director to evaluate each pending message. New messages
+        # are only appended while we wait, so the first n indices stay valid.
+        for i in range(len(pending)):
+            msg = pending[i]
+            eval_result = await self._request_message_evaluation(msg)
+            if eval_result and eval_result.get('process_now'):
+                msg['priority'] = eval_result.get('priority', 0.5)
+                del pending[i]
+                await self._process_queued_message(msg, now - msg['queued_at'])
                 break  # Process one at a time
     
+    async def _process_queued_message(self, msg: Dict[str, Any], wait_time: float):
+        """Take a message off the pending queue and process it with its delay context."""
+        self._pending_space.set()
+        
+        # Process with context about delay
+        msg['metadata'] = {
+            'queued_duration': wait_time,
+            'processing_reason': 'contextually_relevant' if wait_time < 30 else 'timeout'
+        }
+        
+        await self._process_external_input(msg)
+        self.logger.info("Processing queued message", wait_time=wait_time)
+    
     async def _request_message_evaluation(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Request attention director to evaluate a queued message."""
+        # The main loop resolves this when the response arrives
+        self._evaluation_waiter = asyncio.get_running_loop().create_future()
+        
         # Send evaluation request
         await self.send_message(
             "attention_director",
@@ -793,20 +1112,17 @@ class ExperiencerAgent(BaseAgent):
                 "message": message['content'],
                 "current_context": self._get_current_context_summary(),
                 "active_experiments": len(self.active_experiments),
-                "queue_time": (datetime.now() - message['queued_at']).total_seconds()
+                "queue_time": self._t() - message['queued_at']
             }
         )
         
         # Wait briefly for response
-        start_time = datetime.now()
-        while (datetime.now() - start_time).total_seconds() < 0.5:
-            messages = await self.receive_messages()
-            for msg in messages:
-                if msg.message_type == "evaluation_response" and msg.sender == "attention_director":
-                    return msg.metadata
-            await asyncio.sleep(0.05)
-        
-        return None
+        try:
+            return await asyncio.wait_for(self._evaluation_waiter, timeout=0.5)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._evaluation_waiter = None
     
     def _get_current_context_summary(self) -> str:
         """Get a summary of current context for evaluation."""
@@ -819,7 +1135,18 @@ class ExperiencerAgent(BaseAgent):
     
     async def receive_external_input(self, content: str, callback=None):
         """Public method to receive external input."""
-        await self.external_input_queue.put({
+        queue = self.external_input_queue
+        if queue.full():
+            self.logger.warning("External input queue full, applying backpressure",
+                              maxsize=queue.maxsize,
+                              pending=len(self.pending_user_messages))
+        elif queue.qsize() >= queue.maxsize * 0.75:
+            self.logger.warning("External input queue nearly full",
+                              size=queue.qsize(),
+                              maxsize=queue.maxsize)
+        
+        # Blocks when the queue is full, pushing back on the caller
+        await queue.put({
             'content': content,
             'callback': callback,
             'timestamp': datetime.now()
@@ -829,6 +1156,17 @@ class ExperiencerAgent(BaseAgent):
         """Clean up resources."""
         self.logger.info("Experiencer shutting down")
         self.message_bus.unsubscribe(self.agent_id, "attention_approved")
+        
+        # Stop housekeeping and wake the main loop so it can exit
+        tasks = [t for t in (self._timer_task, self._input_task, self._msg_task,
+                             self._inbox_task) if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._timer_task = None
+        
+        # Flush memories the writer had not reached yet
+        await self._stop_memory_writer()
     
     async def _resume_from_sleep(self, wake_context: str, metadata: Dict[str, Any]):
         """Resume experiments after waking from sleep."""
@@ -846,12 +1184,12 @@ class ExperiencerAgent(BaseAgent):
         response = await self.generate_response(resume_prompt)
         
         # Share wake-up thoughts
-        if hasattr(self, 'spontaneous_share_callback'):
+        if self.spontaneous_share_callback:
             await self.spontaneous_share_callback(f"[Waking up] {response}")
         
         # Restart experiments with renewed energy
-        self.last_experiment_share = datetime.now()
-        self.last_mission_check = datetime.now()
+        self.last_experiment_share = self._t()
+        self.last_mission_check = self._t()
     
     async def _on_sleep(self, metadata: Dict[str, Any]):
         """Handle sleep mode activation."""
@@ -873,26 +1211,23 @@ class ExperiencerAgent(BaseAgent):
         self.logger.info("Experiencer waking up", 
                         experiments_to_resume=len(self.active_experiments))
     
-    async def _maybe_generate_suggestion(self):
+    async def _maybe_generate_suggestion(self, now: float):
         """Generate a suggestion for the current problem if it's time."""
         try:
-            now = datetime.now()
-            time_since_last = (now - self.last_suggestion_time).total_seconds()
+            time_since_last = now - self.last_suggestion_time
             
             if time_since_last < self.suggestion_interval:
                 return
             
             # Log that we're checking suggestion generation
-            self.logger.debug("Checking if suggestion generation needed",
-                            time_since_last=time_since_last,
-                            interval=self.suggestion_interval,
-                            suggestions_so_far=len(self.problem_suggestions))
+            if self._debug:
+                self.logger.debug("Checking if suggestion generation needed",
+                                time_since_last=time_since_last,
+                                interval=self.suggestion_interval,
+                                suggestions_so_far=len(self.problem_suggestions))
             
             # Check if we have enough suggestions
-            min_suggestions = self.problem_config.get('generation', {}).get('min_suggestions', 5)
-            max_suggestions = self.problem_config.get('generation', {}).get('max_suggestions', 10)
-            
-            if len(self.problem_suggestions) >= max_suggestions:
+            if len(self.problem_suggestions) >= self.max_suggestions:
                 return
         
             self.logger.info("Generating problem suggestion",
@@ -900,34 +1235,31 @@ class ExperiencerAgent(BaseAgent):
                             suggestions_so_far=len(self.problem_suggestions))
             
             # Analyze the problem and generate a suggestion
-            analysis_prompt = f"""
-Analyze this problem and generate a specific, actionable suggestion:
-
-Problem: {self.current_problem.get('title')}
-Description: {self.current_problem.get('description')}
-Context: {self.current_problem.get('context', '')}
-
-Questions to explore:
-{chr(10).join('- ' + q for q in self.current_problem.get('questions_to_explore', []))}
-
-Based on your analysis, generate ONE specific suggestion that addresses an aspect of this problem.
-Focus on: architectural improvements, behavioral changes, or implementation strategies.
-Be concrete and actionable.
-"""
+            analysis_prompt = self._analysis_prompt
             
             # Use thinking mode for deeper analysis if available
             if self.model_config.get('thinking', {}).get('enabled', False):
-                result = await self.think_and_respond(analysis_prompt, self.current_context)
+                result = await self.think_and_respond(analysis_prompt, self._conversation_context())
                 suggestion_content = result['response']
                 thinking = result.get('thinking', '')
             else:
                 # Fallback to regular response
-                suggestion_content = await self.generate_response(analysis_prompt, self.current_context)
+                suggestion_content = await self.generate_response(analysis_prompt, self._conversation_context())
                 thinking = ""
             
-            # Generate a title for the suggestion
+            # Title and implementation steps both derive only from the content,
+            # so request them together
             title_prompt = f"Create a brief, descriptive title (5-10 words) for this suggestion: {suggestion_content[:200]}..."
-            title = await self.generate_response(title_prompt)
+            steps_prompt = f"""
+Extract 3-5 specific implementation steps from this suggestion:
+{suggestion_content}
+
+Format as a numbered list. If no clear steps exist, suggest logical next actions.
+"""
+            title, steps_response = await asyncio.gather(
+                self._limited(self.generate_response(title_prompt)),
+                self._limited(self.generate_response(steps_prompt))
+            )
             
             # Determine suggestion type based on content
             if "architecture" in suggestion_content.lower() or "structure" in suggestion_content.lower():
@@ -941,17 +1273,10 @@ Be concrete and actionable.
             confidence = min(0.9, 0.5 + (len(thinking) / 1000) * 0.2)  # Base 0.5, up to 0.9
             
             # Extract implementation steps if present
-            steps_prompt = f"""
-Extract 3-5 specific implementation steps from this suggestion:
-{suggestion_content}
-
-Format as a numbered list. If no clear steps exist, suggest logical next actions.
-"""
-            steps_response = await self.generate_response(steps_prompt)
-            implementation_steps = [step.strip() for step in steps_response.split('\n') if step.strip() and step[0].isdigit()]
+            implementation_steps = _STEP_RE.findall(steps_response)
             
             # Use suggestion generator tool
-            if hasattr(self, 'tool_registry'):
+            if self.tool_registry is not None:
                 generator_tool = self.tool_registry.get_tool('suggestion_generator')
                 if generator_tool:
                     result = await generator_tool(
@@ -971,21 +1296,19 @@ Format as a numbered list. If no clear steps exist, suggest logical next actions
                             self.logger.warning("Generator tool returned success but no suggestion")
                         
                         # Save if confidence is high enough
-                        save_threshold = self.problem_config.get('output', {}).get('save_threshold', 0.7)
-                        if confidence >= save_threshold and self.problem_config.get('output', {}).get('auto_save', True):
+                        if confidence >= self.save_threshold and self.auto_save:
                             saver_tool = self.tool_registry.get_tool('suggestion_saver')
                             if saver_tool:
-                                format = self.problem_config.get('output', {}).get('format', 'markdown')
                                 save_result = await saver_tool(
                                     suggestion=suggestion,
-                                    format=format
+                                    format=self.output_format
                                 )
                                 if save_result.get('success'):
                                     self.logger.info("Suggestion saved",
                                                   filepath=save_result.get('filepath'))
                         
                         # Share the suggestion
-                        if hasattr(self, 'spontaneous_share_callback'):
+                        if self.spontaneous_share_callback:
                             share_message = f"💡 New suggestion for {self.current_problem.get('title')}: {title}"
                             await self.spontaneous_share_callback(share_message)
             
@@ -996,40 +1319,45 @@ Format as a numbered list. If no clear steps exist, suggest logical next actions
                             error=str(e),
                             exc_info=True)
     
+    def _progress_due(self) -> bool:
+        """Whether a new multiple of three suggestions is waiting for a progress report."""
+        count = len(self.problem_suggestions)
+        return count > 0 and count % 3 == 0 and count != self._progress_reported
+    
     async def _check_problem_progress(self):
         """Check and report progress on the current problem."""
-        # Only check periodically
-        if len(self.problem_suggestions) == 0 or len(self.problem_suggestions) % 3 != 0:
-            return
+        self._progress_reported = len(self.problem_suggestions)
         
-        if hasattr(self, 'tool_registry'):
+        if self.tool_registry is not None:
             progress_tool = self.tool_registry.get_tool('problem_progress')
             if progress_tool:
-                # Analyze what areas we've covered
-                areas_analyzed = set()
-                for suggestion in self.problem_suggestions:
-                    if "architecture" in suggestion.get('content', '').lower():
-                        areas_analyzed.add("architecture")
-                    if "behavior" in suggestion.get('content', '').lower():
-                        areas_analyzed.add("behavior")
-                    if "implementation" in suggestion.get('content', '').lower():
-                        areas_analyzed.add("implementation")
-                    if "consciousness" in suggestion.get('content', '').lower():
-                        areas_analyzed.add("consciousness modeling")
+                # Analyze what areas we've covered, lowercasing the suggestions once
+                suggestions_text = ' '.join(
+                    s.get('content', '') for s in self.problem_suggestions
+                ).lower()
+                found = 0
+                for match in _PROGRESS_AREA_RE.finditer(suggestions_text):
+                    found |= _PROGRESS_AREA_BITS[match.group()]
+                    if found == _ALL_PROGRESS_AREAS:
+                        break
+                areas_analyzed = [
+                    area for keyword, area in _PROGRESS_AREAS.items()
+                    if found & _PROGRESS_AREA_BITS[keyword]
+                ]
                 
                 # Determine next steps
                 next_steps = []
                 questions = self.current_problem.get('questions_to_explore', [])
                 for question in questions:
-                    covered = any(keyword in ' '.join(s.get('content', '') for s in self.problem_suggestions).lower() 
-                                for keyword in question.lower().split())
+                    covered = any(keyword in suggestions_text
+                                  for keyword in question.lower().split())
                     if not covered:
                         next_steps.append(f"Explore: {question}")
                 
                 result = await progress_tool(
                     problem_id=self.current_problem.get('id'),
                     suggestions_generated=len(self.problem_suggestions),
-                    areas_analyzed=list(areas_analyzed),
+                    areas_analyzed=areas_analyzed,
                     next_steps=next_steps[:3]  # Top 3 next steps
                 )
                 
@@ -1044,7 +1372,7 @@ Format as a numbered list. If no clear steps exist, suggest logical next actions
             "is_processing": self.is_processing,
             "is_sleeping": self.is_sleeping,
             "context_size": len(self.current_context),
-            "decision_count": len(self.decision_history),
+            "decision_count": self.decision_count,
             "pending_inputs": self.external_input_queue.qsize(),
             "queued_messages": len(self.pending_user_messages),
             "active_experiments": len(self.active_experiments)
@@ -1,9 +1,10 @@
 """Sleep Agent - Manages dormancy, summarization, and wake-up context."""
 
 import asyncio
+import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime
+from collections import deque
 import structlog
 
 from agents.base_agent import BaseAgent, Message
@@ -18,6 +19,9 @@ class SleepAgent(BaseAgent):
     summarizes the conversation, and creates wake-up contexts.
     """
     
+    # Per-event decay applied to the counts of patterns that did not recur
+    PATTERN_DECAY = 0.9
+    
     def __init__(self, config: Dict[str, Any], message_bus: Any, memory_store: Any):
         super().__init__("sleep_agent", config, message_bus, memory_store)
         
@@ -27,11 +31,18 @@ class SleepAgent(BaseAgent):
         self.loop_threshold = self.agent_config.get('loop_threshold', 5)  # Same pattern 5 times
         self.wake_context_length = self.agent_config.get('wake_context_length', 3)  # Messages
         
+        # Elapsed-time math uses the monotonic clock; datetime is kept for records
+        self._t = time.monotonic
+        
         # State tracking
-        self.last_sleep_time = datetime.now()
+        self.last_sleep_time = self._t()
         self.is_sleeping = False
-        self.message_history = []
-        self.pattern_counts = defaultdict(int)
+        # Appended in time order, so expired entries are at the left end
+        self.message_history = deque()
+        # pattern -> (count, pattern event index at last update); other patterns'
+        # counts decay by PATTERN_DECAY per event, applied lazily on read
+        self.pattern_counts: Dict[str, tuple] = {}
+        self._pattern_events = 0
         self.agents_to_manage = ['experiencer', 'thoughts', 'attention_director']
         
         # Sleep summaries
@@ -55,82 +66,113 @@ class SleepAgent(BaseAgent):
         
         while self.is_running:
             try:
-                if not self.is_sleeping:
-                    # Collect messages for pattern analysis
-                    messages = await self.receive_messages()
-                    for msg in messages:
-                        await self._analyze_message(msg)
-                    
-                    # Check sleep conditions
-                    should_sleep, reason = await self._check_sleep_conditions()
-                    
-                    if should_sleep:
-                        await self._initiate_sleep(reason)
-                else:
-                    # We're sleeping - just wait
+                if self.is_sleeping:
+                    # A sleep cycle started elsewhere is in progress - just wait
                     await asyncio.sleep(1)
+                    continue
+                
+                # Sleep until a message arrives or the next time-based condition is due
+                messages = await self.wait_for_messages(
+                    timeout=self._next_check_delay(self._t())
+                )
+                
+                # One clock reading serves the whole pass
+                now = self._t()
+                
+                # Collect messages for pattern analysis
+                if messages:
+                    await self._analyze_messages(messages, now)
                 
-                # Small delay
-                await asyncio.sleep(0.5)
+                # Check sleep conditions
+                should_sleep, reason = await self._check_sleep_conditions(now)
+                
+                if should_sleep:
+                    await self._initiate_sleep(reason)
                 
             except Exception as e:
                 self.logger.error("Sleep agent loop error", error=str(e))
                 await asyncio.sleep(1)
     
-    async def _analyze_message(self, message: Message):
-        """Analyze messages for patterns and activity."""
+    def _next_check_delay(self, now: float) -> float:
+        """Seconds until a time-based sleep condition could next be met."""
+        deadline = self.last_sleep_time + self.sleep_interval
+        if self.message_history:
+            # Low-activity check: 30 s of silence, but not within a minute of the last sleep
+            deadline = min(deadline, max(self.message_history[-1]['timestamp'] + 30,
+                                         self.last_sleep_time + 60))
+        # Small floor so the strict comparisons have passed when we wake
+        return max(deadline - now, 0.1)
+    
+    async def _analyze_messages(self, messages: List[Message], now: float):
+        """Analyze a batch of messages for patterns and activity."""
         # Add to history
-        self.message_history.append({
-            'content': message.content,
-            'sender': message.sender,
-            'type': message.message_type,
-            'timestamp': datetime.now()
-        })
+        self.message_history.extend(
+            {
+                'content': message.content,
+                'sender': message.sender,
+                'type': message.message_type,
+                'timestamp': now
+            }
+            for message in messages
+        )
         
         # Keep only recent history
-        cutoff = datetime.now() - timedelta(seconds=self.loop_detection_window)
-        self.message_history = [
-            msg for msg in self.message_history 
-            if msg['timestamp'] > cutoff
-        ]
+        cutoff = now - self.loop_detection_window
+        history = self.message_history
+        while history and history[0]['timestamp'] <= cutoff:
+            history.popleft()
         
+        for message in messages:
+            self._count_pattern(message.content)
+    
+    def _count_pattern(self, content: str):
+        """Count a message's pattern signature; the others decay lazily."""
         # Extract pattern signature
-        pattern = self._extract_pattern(message.content)
+        pattern = self._extract_pattern(content)
         if pattern:
-            self.pattern_counts[pattern] += 1
-            
-            # Decay old patterns
-            for p in list(self.pattern_counts.keys()):
-                if p != pattern:
-                    self.pattern_counts[p] *= 0.9
-                    if self.pattern_counts[p] < 1:
-                        del self.pattern_counts[p]
+            self._pattern_events += 1
+            count = 0.0
+            entry = self.pattern_counts.get(pattern)
+            if entry is not None:
+                # Decayed by every event since its last update except this one
+                count = entry[0] * self.PATTERN_DECAY ** (self._pattern_events - 1 - entry[1])
+                if count < 1:
+                    count = 0.0
+            self.pattern_counts[pattern] = (count + 1, self._pattern_events)
+    
+    def _pattern_count(self, pattern: str) -> float:
+        """Current decayed count for a pattern."""
+        count, seen = self.pattern_counts[pattern]
+        return count * self.PATTERN_DECAY ** (self._pattern_events - seen)
     
     def _extract_pattern(self, content: str) -> Optional[str]:
         """Extract a pattern signature from content."""
-        # Simple pattern extraction - could be made more sophisticated
-        words = content.lower().split()[:5]  # First 5 words
+        # Simple pattern extraction - could be made more sophisticated.
+        # Only the first three words matter, so split no further than that.
+        words = content.split(None, 3)
         if len(words) >= 3:
-            return ' '.join(words[:3])
+            return ' '.join(words[:3]).lower()
         return None
     
-    async def _check_sleep_conditions(self) -> tuple[bool, str]:
+    async def _check_sleep_conditions(self, now: float) -> tuple[bool, str]:
         """Check if it's time to sleep."""
-        now = datetime.now()
-        
         # Check 1: Time-based sleep
-        time_since_sleep = (now - self.last_sleep_time).total_seconds()
+        time_since_sleep = now - self.last_sleep_time
         if time_since_sleep >= self.sleep_interval:
             return True, f"Regular sleep interval reached ({self.sleep_interval}s)"
         
         # Check 2: Loop detection
-        for pattern, count in self.pattern_counts.items():
-            if count >= self.loop_threshold:
+        for pattern in list(self.pattern_counts):
+            count = self._pattern_count(pattern)
+            if count < 1:
+                # Decayed away
+                del self.pattern_counts[pattern]
+            elif count >= self.loop_threshold:
                 return True, f"Loop detected: pattern '{pattern}' repeated {count} times"
         
         # Check 3: Low activity (no messages in last 30 seconds)
         if self.message_history:
-            last_message_age = (now - self.message_history[-1]['timestamp']).total_seconds()
+            last_message_age = now - self.message_history[-1]['timestamp']
             if last_message_age > 30 and time_since_sleep > 60:  # Don't sleep too frequently
                 return True, "Low activity detected"
         
@@ -141,15 +183,15 @@ class SleepAgent(BaseAgent):
         self.logger.info("Initiating sleep mode", reason=reason)
         self.is_sleeping = True
         
-        # Notify all agents to pause
-        for agent_id in self.agents_to_manage:
-            await self.send_message(
-                agent_id,
-                "SLEEP_MODE_ACTIVATED",
-                message_type="system_command",
-                priority=1.0,
-                metadata={"reason": reason}
-            )
+        # Notify all agents to pause in one bus call
+        await self.send_messages([
+            (agent_id, "SLEEP_MODE_ACTIVATED", {
+                "message_type": "system_command",
+                "priority": 1.0,
+                "metadata": {"reason": reason}
+            })
+            for agent_id in self.agents_to_manage
+        ])
         
         # Generate conversation summary
         summary = await self._generate_summary()
@@ -165,11 +207,12 @@ class SleepAgent(BaseAgent):
             'wake_context': wake_context
         })
         
-        # Store in memory for persistence
-        await self.store_memory(
-            f"Sleep cycle: {summary}",
-            memory_type="sleep_summary"
-        )
+        # Persist in the background so the sleep broadcast isn't held up by the store
+        self.queue_memories([{
+            "content": f"Sleep cycle: {summary}",
+            "memory_type": "sleep_summary",
+            "timestamp": datetime.now()
+        }])
         
         # Broadcast sleep status
         await self.send_message(
@@ -243,19 +286,19 @@ class SleepAgent(BaseAgent):
         # Brief delay
         await asyncio.sleep(1)
         
-        # Wake all agents
-        for agent_id in self.agents_to_manage:
-            await self.send_message(
-                agent_id,
-                "SLEEP_MODE_DEACTIVATED",
-                message_type="system_command",
-                priority=1.0,
-                metadata={"wake_context": wake_context[:100]}
-            )
+        # Wake all agents in one bus call
+        await self.send_messages([
+            (agent_id, "SLEEP_MODE_DEACTIVATED", {
+                "message_type": "system_command",
+                "priority": 1.0,
+                "metadata": {"wake_context": wake_context[:100]}
+            })
+            for agent_id in self.agents_to_manage
+        ])
         
         # Reset state
         self.is_sleeping = False
-        self.last_sleep_time = datetime.now()
+        self.last_sleep_time = self._t()
         self.pattern_counts.clear()
         
         # Broadcast wake status
@@ -279,10 +322,11 @@ class SleepAgent(BaseAgent):
         self.message_bus.unsubscribe(self.agent_id, "thoughts")
         self.message_bus.unsubscribe(self.agent_id, "filtered_thoughts")
         self.message_bus.unsubscribe(self.agent_id, "conversation")
+        await self._stop_memory_writer()
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status."""
-        time_since_sleep = (datetime.now() - self.last_sleep_time).total_seconds()
+        time_since_sleep = self._t() - self.last_sleep_time
         
         return {
             **self.get_metrics(),
@@ -290,5 +334,5 @@ class SleepAgent(BaseAgent):
             "time_since_sleep": time_since_sleep,
             "sleep_cycles": len(self.sleep_summaries),
             "pattern_count": len(self.pattern_counts),
-            "max_pattern_repetition": max(self.pattern_counts.values()) if self.pattern_counts else 0
+            "max_pattern_repetition": max(map(self._pattern_count, self.pattern_counts), default=0)
         }
\ No newline at end of file
@@ -1,15 +1,124 @@
 """Thoughts Agent - Autonomous thought generator."""
 
 import asyncio
+import bisect
 import random
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+import re
+import time
+from collections import OrderedDict, deque
+from itertools import accumulate, islice
+from typing import Dict, Any, List, NamedTuple
 import structlog
 
 from agents.base_agent import BaseAgent
 
 logger = structlog.get_logger()
 
+# Prompt templates; only the bracketed field changes between calls
+_FOCUS_ASSOCIATION_PROMPT = (
+    "Generate a brief associative thought related to '{theme}'. "
+    "Make creative connections while staying relevant to this focus area. "
+    "Keep it under 50 words."
+)
+# Wraps free text that may contain braces, so it is joined rather than formatted
+_TRIGGERED_PROMPT_PREFIX = "Generate an immediate associative thought in response to: '"
+_TRIGGERED_PROMPT_SUFFIX = "'. Keep it brief and relevant."
+_WONDER_PROMPT = (
+    "Generate a brief wondering or curious thought about {topic}. "
+    "Start with 'I wonder...' or 'What if...' Keep it under 40 words."
+)
+_OBSERVATION_PROMPT = (
+    "Make a brief observation about {focus}. "
+    "Be insightful but concise. Keep it under 40 words."
+)
+_REFLECTION_PROMPT = (
+    "Reflect briefly on these recent thoughts and find a deeper meaning "
+    "or pattern: {recent}\nKeep your reflection under 50 words."
+)
+
+_THOUGHT_PATTERNS = (
+    "hypothesis",         # New: Form testable hypotheses
+    "experiment",         # New: Run active experiments
+    "building_progress",  # New: Track what's being built
+    "mission_progress",   # New: Assess mission advancement
+    "association",
+    "memory",
+    "wonder",
+    "observation",
+    "reflection",
+    "insight",
+    "teaching_prep"       # New: Prepare discoveries for teaching
+)
+_PROBLEM_THOUGHT_PATTERNS = (
+    "problem_analysis",    # Analyze aspects of the current problem
+    "solution_brainstorm", # Brainstorm potential solutions
+    "implementation_idea", # Think about how to implement solutions
+    "critique",           # Critical analysis of existing approach
+)
+
+_WONDER_TOPICS = (
+    "consciousness", "creativity", "connection", "possibility",
+    "understanding", "perception", "time", "memory", "learning"
+)
+_OBSERVATION_FOCI = (
+    "patterns in our conversations",
+    "the flow of thoughts",
+    "connections between ideas",
+    "the nature of understanding",
+    "how memories influence thinking"
+)
+_PROBLEM_ASPECTS = (
+    "strengths of the current approach",
+    "weaknesses in the architecture",
+    "missing components",
+    "theoretical foundations",
+    "practical limitations"
+)
+_IMPLEMENTATION_FOCI = (
+    "code structure",
+    "system design",
+    "integration approach",
+    "testing strategy",
+    "performance considerations"
+)
+_CRITIQUE_ANGLES = (
+    "assumptions we're making",
+    "potential blind spots",
+    "scalability concerns",
+    "philosophical issues",
+    "practical challenges"
+)
+
+# Thought kinds whose prompts need no live context, so several can be written
+# ahead of time in a single model call
+_BATCH_KINDS = {
+    "wonder": "a wondering or curious thought starting with 'I wonder...' or 'What if...' (under 40 words)",
+    "observation": "an insightful observation about patterns in conversations, the flow of thoughts, "
+                   "connections between ideas or how memories influence thinking (under 40 words)",
+    "experiment": "a thought experiment you're currently running, formatted 'Experimenting with: [concept]. "
+                  "Method: [approach]. Current observation: [what you're noticing]' (under 70 words)",
+    "mission_progress": "an action-oriented assessment of your progress toward understanding the world "
+                        "through building and experimenting, and your next experimental target (under 50 words)",
+}
+_BATCH_PER_KIND = 2
+_BATCH_PROMPT = (
+    f"Generate {_BATCH_PER_KIND * len(_BATCH_KINDS)} diverse, independent thoughts, one per line. "
+    "Start each line with its kind in square brackets, for example [wonder], and write "
+    f"{_BATCH_PER_KIND} of each kind:\n"
+    + "\n".join(f"[{kind}] {description}" for kind, description in _BATCH_KINDS.items())
+    + "\nOutput only the tagged lines."
+)
+_BATCH_LINE_RE = re.compile(r"^[ \t]*\[(\w+)\][ \t]*(.+?)[ \t]*$", re.MULTILINE)
+
+
+class ThoughtRecord(NamedTuple):
+    """A recently generated thought, with the previews prompts quote from it."""
+    content: str
+    preview_30: str
+    preview_50: str
+    type: str
+    timestamp: float  # Monotonic seconds
+
 
 class ThoughtsAgent(BaseAgent):
     """
@@ -17,14 +126,27 @@ class ThoughtsAgent(BaseAgent):
     It represents the continuous background mental activity.
     """
     
+    # Memory lookups are reused for this many seconds, for up to this many queries
+    MEMORY_CACHE_TTL = 30.0
+    MEMORY_CACHE_SIZE = 128
+    # Pre-generated thoughts older than this many seconds are discarded
+    BATCH_TTL = 120.0
+    
     def __init__(self, config: Dict[str, Any], message_bus: Any, memory_store: Any):
         super().__init__("thoughts", config, message_bus, memory_store)
         
+        # All interval bookkeeping uses monotonic seconds
+        self._t = time.monotonic
+        # Agent-local generator for thought selection and priorities
+        self._rng = random.Random()
+        
         # Stream generation settings
         self.base_thoughts_per_minute = self.agent_config.get('thoughts_per_minute', 1)
         self.thoughts_per_minute = self.base_thoughts_per_minute
         self.context_window = self.agent_config.get('context_window', 10)
         self.creativity_boost = self.agent_config.get('creativity_boost', 0.2)
+        # Thoughts stop while more than this many await the attention director
+        self.max_pending_thoughts = self.agent_config.get('max_pending_thoughts', 2 * self.context_window)
         
         # Adaptive frequency settings
         self.adaptive_config = self.agent_config.get('adaptive_frequency', {})
@@ -41,40 +163,53 @@ class ThoughtsAgent(BaseAgent):
         self.theme_update_interval = self.conversation_config.get('update_interval', 45)
         
         # Thought generation state
-        self.recent_thoughts = []
+        self.recent_thoughts = deque(maxlen=self.context_window)  # Oldest fall off on append
+        # Joined previews of the last few thoughts, rebuilt only after a new thought
+        self._recent_context = ""
+        self._recent_reflection = ""
+        self._recent_dirty = False
         self.conversation_themes = []  # Abstract themes from conversations
         self.focus_areas = []  # Current focus areas from attention director
-        self.last_conversation_time = datetime.now()
-        self.last_theme_update = datetime.now()
+        self.last_conversation_time = self._t()
+        self.last_theme_update = self._t()
         self.conversation_active = False
+        # (fetched_at, memories) by (query, limit) of recent memory lookups (LRU)
+        self._memory_query_cache: OrderedDict = OrderedDict()
         
         # Problem-solving configuration
         self.problem_config = config.get('problem_solving', {})
         self.problem_solving_enabled = self.problem_config.get('enabled', False)
         self.current_problem = None
         
-        self.thought_patterns = [
-            "hypothesis",         # New: Form testable hypotheses
-            "experiment",         # New: Run active experiments
-            "building_progress",  # New: Track what's being built
-            "mission_progress",   # New: Assess mission advancement
-            "association",
-            "memory",
-            "wonder",
-            "observation",
-            "reflection",
-            "insight",
-            "teaching_prep"       # New: Prepare discoveries for teaching
-        ]
+        self.thought_patterns = _THOUGHT_PATTERNS
         
         # Add problem-solving patterns if enabled
         if self.problem_solving_enabled:
-            self.thought_patterns.extend([
-                "problem_analysis",    # Analyze aspects of the current problem
-                "solution_brainstorm", # Brainstorm potential solutions
-                "implementation_idea", # Think about how to implement solutions
-                "critique",           # Critical analysis of existing approach
-            ])
+            self.thought_patterns += _PROBLEM_THOUGHT_PATTERNS
+        
+        # Position of each pattern, and cumulative selection weights per
+        # (focus, themes, problem) state, filled in on first use
+        self._pattern_index = {p: i for i, p in enumerate(self.thought_patterns)}
+        self._cum_weights: Dict[tuple, List[float]] = {}
+        
+        # Generator for each thought pattern, looked up once per thought
+        self._thought_handlers = {
+            "hypothesis": self._generate_hypothesis,
+            "experiment": self._generate_experiment,
+            "building_progress": self._generate_building_progress,
+            "mission_progress": self._generate_mission_progress,
+            "teaching_prep": self._generate_teaching_preparation,
+            "association": self._generate_association,
+            "memory": self._generate_memory_recall,
+            "wonder": self._generate_wonder,
+            "observation": self._generate_observation,
+            "reflection": self._generate_reflection,
+            "insight": self._generate_insight,
+            "problem_analysis": self._generate_problem_analysis,
+            "solution_brainstorm": self._generate_solution_brainstorm,
+            "implementation_idea": self._generate_implementation_idea,
+            "critique": self._generate_critique,
+        }
         
         # Mission-focused configuration
         self.mission_config = self.agent_config.get('mission_focus', {})
@@ -83,9 +218,22 @@ class ThoughtsAgent(BaseAgent):
         self.building_probability = self.mission_config.get('building_probability', 0.3)
         
         # Timing
-        self.last_thought_time = datetime.now()
+        self.last_thought_time = self._t()
         self.thought_interval = 60.0 / self.thoughts_per_minute
         
+        # Message handling and thought scheduling run as separate tasks
+        self._msg_task = None
+        self._tick_task = None
+        # Bounds how many messages are handled (and model calls made) at once
+        self._processing_slots = asyncio.Semaphore(
+            self.agent_config.get('max_concurrent_messages', 4)
+        )
+        
+        # Pre-generated (kind, content, created_at) thoughts, refilled by one
+        # model call when a kind runs out
+        self._thought_batch = deque(maxlen=4 * _BATCH_PER_KIND * len(_BATCH_KINDS))
+        self._batch_task = None
+        
     async def _initialize(self):
         """Initialize the Thoughts agent."""
         self.logger.info("Thoughts agent initializing",
@@ -118,20 +266,49 @@ class ThoughtsAgent(BaseAgent):
             self.message_bus.subscribe(self.agent_id, "suggestion_generated")
         
         # Load some initial memories to seed thoughts
-        initial_memories = await self.retrieve_memories("", limit=20)
+        initial_memories = await self._recall_memories("", limit=20)
         if initial_memories:
             self.logger.info("Loaded initial memories", count=len(initial_memories))
+        
+        # Load the model now so the first thought doesn't pay for it; Ollama
+        # loads a model without generating anything for an empty prompt
+        try:
+            await asyncio.wait_for(
+                self.ollama.generate(model=self._model_name, prompt=""),
+                timeout=self.model_config.get('timeout', 45)
+            )
+        except Exception as e:
+            self.logger.warning("Model warm-up failed", error=str(e))
     
     async def _run_loop(self):
-        """Main loop - generate autonomous thoughts continuously."""
+        """Main loop - handle incoming messages and generate thoughts on schedule."""
         self.logger.info("Thoughts agent started")
         
+        # Messages are handled as they arrive while thoughts keep their own cadence
+        self._msg_task = asyncio.create_task(self._message_pump())
+        self._tick_task = asyncio.create_task(self._thought_ticker())
+        await asyncio.gather(self._msg_task, self._tick_task, return_exceptions=True)
+    
+    async def _message_pump(self):
+        """Process incoming messages (external inputs, etc.) as soon as they arrive."""
         while self.is_running:
             try:
-                # Check for incoming messages (external inputs, etc.)
-                messages = await self.receive_messages()
-                for message in messages:
-                    await self._process_message(message)
+                messages = await self.wait_for_messages()
+                await self.process_concurrently(messages, self._process_message,
+                                                self._processing_slots)
+                
+            except Exception as e:
+                self.logger.error("Message processing error", error=str(e), exc_info=True)
+                await asyncio.sleep(1)
+    
+    async def _thought_ticker(self):
+        """Generate a thought each time the current thought interval elapses."""
+        while self.is_running:
+            try:
+                if self.is_sleeping:
+                    # Thoughts resume once the sleep cycle ends
+                    await asyncio.sleep(1)
+                    continue
                 
                 # Update adaptive frequency if enabled
                 if self.adaptive_enabled:
@@ -144,27 +321,27 @@ class ThoughtsAgent(BaseAgent):
                         self.base_thoughts_per_minute * 1.3
                     )
                 
-                # Generate thought if it's time
-                now = datetime.now()
-                time_since_last = (now - self.last_thought_time).total_seconds()
-                
-                # Log timing info periodically
-                if int(time_since_last) % 30 == 0 and int(time_since_last) > 0:
-                    self.logger.info("Thoughts agent timing check",
-                                   time_since_last_thought=time_since_last,
-                                   thought_interval=self.thought_interval,
-                                   thoughts_per_minute=self.thoughts_per_minute,
-                                   conversation_active=self.conversation_active)
+                # Sleep until the next thought is due; the interval may have
+                # changed meanwhile, so recheck it before generating
+                delay = self.last_thought_time + self.thought_interval - self._t()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
                 
-                if time_since_last >= self.thought_interval and not self.is_sleeping:
-                    self.logger.info("Generating thought",
-                                   time_since_last=time_since_last,
-                                   interval=self.thought_interval)
-                    await self._generate_thought()
-                    self.last_thought_time = now
+                # Back-pressure: skip this thought if the attention director
+                # hasn't caught up with the ones already sent
+                backlog = self.message_bus.get_queue_size("attention_director")
+                if backlog > self.max_pending_thoughts:
+                    self.logger.debug("Skipping thought, attention director backlogged",
+                                    backlog=backlog)
+                    self.last_thought_time = self._t()
+                    continue
                 
-                # Small sleep to prevent CPU spinning
-                await asyncio.sleep(0.5)
+                self.logger.info("Generating thought",
+                               time_since_last=self._t() - self.last_thought_time,
+                               interval=self.thought_interval)
+                self.last_thought_time = self._t()
+                await self._generate_thought()
                 
             except Exception as e:
                 self.logger.error("Thought generation error", error=str(e), exc_info=True)
@@ -172,134 +349,59 @@ class ThoughtsAgent(BaseAgent):
     
     async def _generate_thought(self):
         """Generate an autonomous thought."""
-        self.logger.debug("Starting thought generation",
-                         thought_patterns=self.thought_patterns,
-                         focus_areas_count=len(self.focus_areas),
-                         conversation_themes_count=len(self.conversation_themes))
-        
-        # Mission-focused thought generation weights
-        weights = [1.0] * len(self.thought_patterns)
-        
-        # Always prioritize mission-aligned thoughts
-        if "hypothesis" in self.thought_patterns:
-            weights[self.thought_patterns.index("hypothesis")] = 3.0
-        if "experiment" in self.thought_patterns:
-            weights[self.thought_patterns.index("experiment")] = 3.5
-        if "building_progress" in self.thought_patterns:
-            weights[self.thought_patterns.index("building_progress")] = 2.5
-        if "mission_progress" in self.thought_patterns:
-            weights[self.thought_patterns.index("mission_progress")] = 2.0
-        if "teaching_prep" in self.thought_patterns:
-            weights[self.thought_patterns.index("teaching_prep")] = 2.0
-            
-        # If we have focus areas, further boost related experimental thoughts
-        if self.focus_areas:
-            # Boost association and observation for focus-related insights
-            if "association" in self.thought_patterns:
-                weights[self.thought_patterns.index("association")] *= 1.5
-            if "observation" in self.thought_patterns:
-                weights[self.thought_patterns.index("observation")] *= 1.5
-        
-        # Reduce conversation influence
-        if self.conversation_awareness_enabled and self.conversation_themes:
-            # Only slight influence from conversations
-            if "association" in self.thought_patterns:
-                weights[self.thought_patterns.index("association")] *= (1 + self.influence_strength)
-        
-        # Boost problem-solving thoughts if enabled and problem is loaded
-        if self.problem_solving_enabled and self.current_problem:
-            problem_weight = self.problem_config.get('focus', {}).get('problem_weight', 0.8)
-            if "problem_analysis" in self.thought_patterns:
-                weights[self.thought_patterns.index("problem_analysis")] = 4.0 * problem_weight
-            if "solution_brainstorm" in self.thought_patterns:
-                weights[self.thought_patterns.index("solution_brainstorm")] = 3.5 * problem_weight
-            if "implementation_idea" in self.thought_patterns:
-                weights[self.thought_patterns.index("implementation_idea")] = 3.0 * problem_weight
-            if "critique" in self.thought_patterns:
-                weights[self.thought_patterns.index("critique")] = 2.5 * problem_weight
-        
-        thought_type = random.choices(self.thought_patterns, weights=weights)[0]
-        self.logger.debug("Selected thought type", type=thought_type, weights=weights)
+        if self._debug:
+            self.logger.debug("Starting thought generation",
+                             thought_patterns=self.thought_patterns,
+                             focus_areas_count=len(self.focus_areas),
+                             conversation_themes_count=len(self.conversation_themes))
+        
+        cum_weights = self._cumulative_weights()
+        thought_type = self.thought_patterns[
+            bisect.bisect(cum_weights, self._rng.random() * cum_weights[-1])
+        ]
+        if self._debug:
+            self.logger.debug("Selected thought type", type=thought_type, cum_weights=cum_weights)
         
         try:
-            if thought_type == "hypothesis":
-                thought = await self._generate_hypothesis()
-            elif thought_type == "experiment":
-                thought = await self._generate_experiment()
-            elif thought_type == "building_progress":
-                thought = await self._generate_building_progress()
-            elif thought_type == "mission_progress":
-                thought = await self._generate_mission_progress()
-            elif thought_type == "teaching_prep":
-                thought = await self._generate_teaching_preparation()
-            elif thought_type == "association":
-                thought = await self._generate_association()
-            elif thought_type == "memory":
-                thought = await self._generate_memory_recall()
-            elif thought_type == "wonder":
-                thought = await self._generate_wonder()
-            elif thought_type == "observation":
-                thought = await self._generate_observation()
-            elif thought_type == "reflection":
-                thought = await self._generate_reflection()
-            elif thought_type == "insight":
-                thought = await self._generate_insight()
-            elif thought_type == "problem_analysis":
-                thought = await self._generate_problem_analysis()
-            elif thought_type == "solution_brainstorm":
-                thought = await self._generate_solution_brainstorm()
-            elif thought_type == "implementation_idea":
-                thought = await self._generate_implementation_idea()
-            elif thought_type == "critique":
-                thought = await self._generate_critique()
-            else:
-                thought = None
+            handler = self._thought_handlers.get(thought_type)
+            thought = await handler() if handler else None
             
             if thought:
-                # Store the thought
-                self.recent_thoughts.append({
-                    "content": thought['content'],
-                    "type": thought_type,
-                    "timestamp": datetime.now()
-                })
+                # Store the thought, with the previews that prompts quote (a
+                # short thought's slice is the original string, not a copy)
+                content = thought['content']
+                record = ThoughtRecord(content, content[:30], content[:50], thought_type, self._t())
+                self.recent_thoughts.append(record)
+                self._recent_dirty = True
                 
-                # Keep recent thoughts limited
-                if len(self.recent_thoughts) > self.context_window:
-                    self.recent_thoughts = self.recent_thoughts[-self.context_window:]
-                
-                # Send to attention director
-                await self.send_message(
-                    "attention_director",
-                    thought['content'],
-                    message_type="thought",
-                    priority=thought.get('priority', 0.3),
-                    metadata={
-                        "type": thought_type,
-                        "trigger": thought.get('trigger', 'spontaneous')
-                    }
-                )
-                
-                # Also broadcast for thought monitor (mark as raw)
-                await self.send_message(
-                    "topic:thoughts",
-                    thought['content'],
-                    message_type="thought",
-                    priority=thought.get('priority', 0.3),
-                    metadata={
-                        "type": thought_type,
-                        "trigger": thought.get('trigger', 'spontaneous'),
-                        "raw": True  # Mark as raw thought before filtering
-                    }
-                )
+                # Send to attention director and broadcast for the thought
+                # monitor (marked raw as before filtering) in one bus call
+                priority = thought.get('priority', 0.3)
+                metadata = {
+                    "type": thought_type,
+                    "trigger": thought.get('trigger', 'spontaneous')
+                }
+                await self.send_messages([
+                    ("attention_director", content, {
+                        "message_type": "thought",
+                        "priority": priority,
+                        "metadata": metadata
+                    }),
+                    ("topic:thoughts", content, {
+                        "message_type": "thought",
+                        "priority": priority,
+                        "metadata": {**metadata, "raw": True}
+                    }),
+                ])
                 
                 self.logger.info("Generated thought successfully", 
                                 type=thought_type,
-                                priority=thought.get('priority', 0.3),
-                                preview=thought['content'][:50])
+                                priority=priority,
+                                preview=record.preview_50)
             else:
                 self.logger.debug("Thought type returned None, trying fallback", type=thought_type)
                 # If insight or memory returned None, fall back to association
-                if thought_type in ["insight", "memory"] and "association" in self.thought_patterns:
+                if thought_type in ("insight", "memory") and "association" in self.thought_patterns:
                     thought = await self._generate_association()
                     if thought:
                         # Send the fallback thought
@@ -325,6 +427,59 @@ class ThoughtsAgent(BaseAgent):
                             error=str(e),
                             exc_info=True)
     
+    def _cumulative_weights(self) -> List[float]:
+        """Cumulative selection weights of thought_patterns for the current state.
+        
+        Weights only depend on whether focus areas, conversation themes and a
+        problem are present, so each combination is accumulated once.
+        """
+        key = (
+            bool(self.focus_areas),
+            bool(self.conversation_awareness_enabled and self.conversation_themes),
+            bool(self.problem_solving_enabled and self.current_problem),
+        )
+        cum_weights = self._cum_weights.get(key)
+        if cum_weights is None:
+            cum_weights = list(accumulate(self._pattern_weights(*key)))
+            self._cum_weights[key] = cum_weights
+        return cum_weights
+    
+    def _pattern_weights(self, has_focus: bool, has_themes: bool, has_problem: bool) -> List[float]:
+        """Mission-focused selection weight of each thought pattern."""
+        index = self._pattern_index
+        weights = [1.0] * len(self.thought_patterns)
+        
+        def scale(pattern: str, factor: float):
+            if pattern in index:
+                weights[index[pattern]] *= factor
+        
+        # Always prioritize mission-aligned thoughts
+        scale("hypothesis", 3.0)
+        scale("experiment", 3.5)
+        scale("building_progress", 2.5)
+        scale("mission_progress", 2.0)
+        scale("teaching_prep", 2.0)
+        
+        # If we have focus areas, boost association and observation for
+        # focus-related insights
+        if has_focus:
+            scale("association", 1.5)
+            scale("observation", 1.5)
+        
+        # Only slight influence from conversations
+        if has_themes:
+            scale("association", 1 + self.influence_strength)
+        
+        # Boost problem-solving thoughts if a problem is loaded
+        if has_problem:
+            problem_weight = self.problem_config.get('focus', {}).get('problem_weight', 0.8)
+            scale("problem_analysis", 4.0 * problem_weight)
+            scale("solution_brainstorm", 3.5 * problem_weight)
+            scale("implementation_idea", 3.0 * problem_weight)
+            scale("critique", 2.5 * problem_weight)
+        
+        return weights
+    
     async def _generate_association(self) -> Dict[str, Any]:
         """Generate an associative thought with optional deeper reasoning."""
         # Get recent context
@@ -332,12 +487,8 @@ class ThoughtsAgent(BaseAgent):
         
         # Check if we have focus areas
         if self.focus_areas:
-            focus = random.choice(self.focus_areas)
-            prompt = (
-                f"Generate a brief associative thought related to '{focus['theme']}'. "
-                "Make creative connections while staying relevant to this focus area. "
-                "Keep it under 50 words."
-            )
+            focus = self._rng.choice(self.focus_areas)
+            prompt = _FOCUS_ASSOCIATION_PROMPT.format(theme=focus['theme'])
             priority_boost = 0.2
             use_thinking = True  # Use thinking for focused associations
         else:
@@ -349,7 +500,7 @@ class ThoughtsAgent(BaseAgent):
             use_thinking = False
         
         if recent_context:
-            prompt += f"\nRecent context: {recent_context}"
+            prompt = "".join((prompt, "\nRecent context: ", recent_context))
         
         # Use thinking mode for deeper associations when focused
         if use_thinking and self.model_config.get('thinking', {}).get('enabled', False):
@@ -365,35 +516,35 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": content,
-            "priority": random.uniform(0.2 + priority_boost, 0.6 + priority_boost)
+            "priority": self._rng.uniform(0.2 + priority_boost, 0.6 + priority_boost)
         }
     
     async def _generate_memory_recall(self) -> Dict[str, Any]:
         """Recall a relevant memory."""
         # Search for memories related to recent thoughts
         if self.recent_thoughts:
-            query = " ".join([t['content'][:30] for t in self.recent_thoughts[-3:]])
-            memories = await self.retrieve_memories(query, limit=5)
+            query = " ".join([t.preview_30 for t in self._last_thoughts(3)])
+            memories = await self._recall_memories(query, limit=5)
             
             if memories:
-                memory = random.choice(memories)
+                memory = self._rng.choice(memories)
                 content = f"I remember: {memory['content']}"
                 
                 return {
                     "content": content,
-                    "priority": random.uniform(0.3, 0.7),
+                    "priority": self._rng.uniform(0.3, 0.7),
                     "trigger": "association"
                 }
         
         # Random memory recall
-        memories = await self.retrieve_memories("", limit=20)
+        memories = await self._recall_memories("", limit=20)
         if memories:
-            memory = random.choice(memories)
+            memory = self._rng.choice(memories)
             content = f"A memory surfaces: {memory['content']}"
             
             return {
                 "content": content,
-                "priority": random.uniform(0.2, 0.5),
+                "priority": self._rng.uniform(0.2, 0.5),
                 "trigger": "random"
             }
         
@@ -401,57 +552,33 @@ class ThoughtsAgent(BaseAgent):
     
     async def _generate_wonder(self) -> Dict[str, Any]:
         """Generate a wondering/curious thought."""
-        topics = [
-            "consciousness", "creativity", "connection", "possibility",
-            "understanding", "perception", "time", "memory", "learning"
-        ]
-        
-        topic = random.choice(topics)
-        
-        prompt = (
-            f"Generate a brief wondering or curious thought about {topic}. "
-            "Start with 'I wonder...' or 'What if...' Keep it under 40 words."
-        )
-        
-        content = await self.generate_response(prompt)
+        content = await self._take_batched("wonder")
+        if content is None:
+            prompt = _WONDER_PROMPT.format(topic=self._rng.choice(_WONDER_TOPICS))
+            content = await self.generate_response(prompt)
         
         return {
             "content": content,
-            "priority": random.uniform(0.3, 0.6)
+            "priority": self._rng.uniform(0.3, 0.6)
         }
     
     async def _generate_observation(self) -> Dict[str, Any]:
         """Generate an observation about current state or patterns."""
-        observations = [
-            "patterns in our conversations",
-            "the flow of thoughts",
-            "connections between ideas",
-            "the nature of understanding",
-            "how memories influence thinking"
-        ]
-        
-        focus = random.choice(observations)
-        
-        prompt = (
-            f"Make a brief observation about {focus}. "
-            "Be insightful but concise. Keep it under 40 words."
-        )
-        
-        content = await self.generate_response(prompt)
+        content = await self._take_batched("observation")
+        if content is None:
+            prompt = _OBSERVATION_PROMPT.format(focus=self._rng.choice(_OBSERVATION_FOCI))
+            content = await self.generate_response(prompt)
         
         return {
             "content": content,
-            "priority": random.uniform(0.3, 0.7)
+            "priority": self._rng.uniform(0.3, 0.7)
         }
     
     async def _generate_reflection(self) -> Dict[str, Any]:
         """Generate a reflective thought."""
         if self.recent_thoughts:
-            recent = " ".join([t['content'][:50] for t in self.recent_thoughts[-3:]])
-            prompt = (
-                "Reflect briefly on these recent thoughts and find a deeper meaning "
-                f"or pattern: {recent}\nKeep your reflection under 50 words."
-            )
+            self._refresh_recent()
+            prompt = _REFLECTION_PROMPT.format(recent=self._recent_reflection)
         else:
             prompt = (
                 "Generate a brief reflective thought about existence, consciousness, "
@@ -462,13 +589,13 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": content,
-            "priority": random.uniform(0.4, 0.8)
+            "priority": self._rng.uniform(0.4, 0.8)
         }
     
     async def _generate_insight(self) -> Dict[str, Any]:
         """Generate an insightful realization using deeper reasoning."""
         # Insights are rarer and higher priority
-        if random.random() > 0.7:  # 30% chance
+        if self._rng.random() > 0.7:  # 30% chance
             prompt = (
                 "Generate a brief but profound insight or realization. "
                 "It should feel like a sudden understanding or 'aha' moment. "
@@ -497,7 +624,7 @@ class ThoughtsAgent(BaseAgent):
             
             return {
                 "content": f"💡 {content}",
-                "priority": random.uniform(0.7 + priority_boost, 0.95)
+                "priority": self._rng.uniform(0.7 + priority_boost, 0.95)
             }
         
         # Return None if insight not generated (70% of the time)
@@ -509,7 +636,7 @@ class ThoughtsAgent(BaseAgent):
         # Handle conversation activity signals
         if message.message_type == "conversation_activity":
             self.conversation_active = message.metadata.get('active', False)
-            self.last_conversation_time = datetime.now()
+            self.last_conversation_time = self._t()
             self.logger.debug("Conversation activity updated", active=self.conversation_active)
         
         # Handle conversation themes
@@ -517,7 +644,7 @@ class ThoughtsAgent(BaseAgent):
             themes = message.metadata.get('themes', [])
             if themes:
                 self.conversation_themes = themes
-                self.last_theme_update = datetime.now()
+                self.last_theme_update = self._t()
                 self.logger.debug("Updated conversation themes", count=len(themes))
         
         # Handle focus emergence
@@ -528,7 +655,7 @@ class ThoughtsAgent(BaseAgent):
                 self.focus_areas.append({
                     'theme': theme,
                     'keywords': keywords,
-                    'emerged_at': datetime.now()
+                    'emerged_at': self._t()
                 })
                 self.logger.info("New focus area registered", theme=theme)
                 # Generate immediate thought about the new focus
@@ -548,10 +675,7 @@ class ThoughtsAgent(BaseAgent):
             # High priority external input - trigger immediate association
             self.logger.debug("External input triggered association")
             
-            prompt = (
-                f"Generate an immediate associative thought in response to: "
-                f"'{message.content}'. Keep it brief and relevant."
-            )
+            prompt = "".join((_TRIGGERED_PROMPT_PREFIX, message.content, _TRIGGERED_PROMPT_SUFFIX))
             
             content = await self.generate_response(prompt)
             
@@ -581,21 +705,91 @@ class ThoughtsAgent(BaseAgent):
                 suggestion_title = message.metadata.get('title', 'Unknown')
                 self.logger.debug("Reacting to new suggestion", title=suggestion_title)
     
+    async def _recall_memories(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Retrieve memories, reusing a recent result for the same query."""
+        key = (query, limit)
+        now = self._t()
+        cached = self._memory_query_cache.get(key)
+        if cached is not None and now - cached[0] < self.MEMORY_CACHE_TTL:
+            self._memory_query_cache.move_to_end(key)
+            return cached[1]
+        
+        memories = await self.retrieve_memories(query, limit=limit)
+        
+        self._memory_query_cache[key] = (now, memories)
+        self._memory_query_cache.move_to_end(key)
+        if len(self._memory_query_cache) > self.MEMORY_CACHE_SIZE:
+            self._memory_query_cache.popitem(last=False)
+        return memories
+    
+    async def _take_batched(self, kind: str):
+        """Take a pre-generated thought of this kind, refilling the batch on a miss.
+        
+        A miss waits for one batch refill, joining one already running, instead
+        of calling the model alongside it. Returns None if the refill produced
+        nothing of this kind, leaving the caller to generate the thought itself.
+        """
+        content = self._pop_batched(kind)
+        if content is None:
+            # A refill that finished without suspending has already completed
+            # here, so a done task is treated like no task at all
+            if self._batch_task is None or self._batch_task.done():
+                self._batch_task = asyncio.create_task(self._refill_thought_batch())
+            await asyncio.shield(self._batch_task)
+            content = self._pop_batched(kind)
+        return content
+    
+    def _pop_batched(self, kind: str):
+        """Pop a batched thought of this kind, dropping those older than BATCH_TTL."""
+        # Refills append in time order, so expired thoughts are on the left
+        cutoff = self._t() - self.BATCH_TTL
+        while self._thought_batch and self._thought_batch[0][2] < cutoff:
+            self._thought_batch.popleft()
+        
+        for i, (batch_kind, content, _) in enumerate(self._thought_batch):
+            if batch_kind == kind:
+                del self._thought_batch[i]
+                return content
+        return None
+    
+    async def _refill_thought_batch(self):
+        """Generate several context-free thoughts with one model call."""
+        try:
+            response = await self.generate_response(_BATCH_PROMPT)
+            created_at = self._t()
+            added = 0
+            for kind, content in _BATCH_LINE_RE.findall(response):
+                kind = kind.lower()
+                if kind in _BATCH_KINDS:
+                    self._thought_batch.append((kind, content, created_at))
+                    added += 1
+            self.logger.debug("Refilled thought batch", added=added, size=len(self._thought_batch))
+        except Exception as e:
+            self.logger.error("Thought batch refill failed", error=str(e))
+    
     def _get_recent_context(self) -> str:
         """Get a summary of recent thoughts for context."""
-        if not self.recent_thoughts:
-            return ""
-        
-        recent = self.recent_thoughts[-3:]
-        return " | ".join([t['content'][:50] for t in recent])
+        self._refresh_recent()
+        return self._recent_context
+    
+    def _refresh_recent(self):
+        """Rebuild the joined recent-thought strings if a thought was added since."""
+        if self._recent_dirty:
+            previews = [t.preview_50 for t in self._last_thoughts(3)]
+            self._recent_context = " | ".join(previews)
+            self._recent_reflection = " ".join(previews)
+            self._recent_dirty = False
+    
+    def _last_thoughts(self, n: int):
+        """Iterate over the n most recent thoughts, oldest first."""
+        return islice(self.recent_thoughts, max(len(self.recent_thoughts) - n, 0), None)
     
     def _update_adaptive_frequency(self):
         """Update thought generation frequency based on conversation state."""
         if not self.adaptive_enabled:
             return
         
-        now = datetime.now()
-        time_since_conversation = (now - self.last_conversation_time).total_seconds()
+        time_since_conversation = self._t() - self.last_conversation_time
         
         # Determine if we're in active conversation or idle
         if self.conversation_active or time_since_conversation < 60:
@@ -633,25 +827,27 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": content,
-            "priority": random.uniform(0.6, 0.9),  # High priority for hypotheses
+            "priority": self._rng.uniform(0.6, 0.9),  # High priority for hypotheses
             "metadata": {"type": "hypothesis", "testable": True}
         }
     
     async def _generate_experiment(self) -> Dict[str, Any]:
         """Generate an active thought experiment in progress."""
-        prompt = (
-            "Describe a thought experiment you're currently running. "
-            "Format: 'Experimenting with: [concept]. Method: [approach]. "
-            "Current observation: [what you're noticing]'. "
-            "Focus on building understanding through mental simulation. "
-            "Keep it under 70 words."
-        )
-        
-        content = await self.generate_response(prompt)
+        content = await self._take_batched("experiment")
+        if content is None:
+            prompt = (
+                "Describe a thought experiment you're currently running. "
+                "Format: 'Experimenting with: [concept]. Method: [approach]. "
+                "Current observation: [what you're noticing]'. "
+                "Focus on building understanding through mental simulation. "
+                "Keep it under 70 words."
+            )
+            
+            content = await self.generate_response(prompt)
         
         return {
             "content": content,
-            "priority": random.uniform(0.7, 0.95),  # Very high priority
+            "priority": self._rng.uniform(0.7, 0.95),  # Very high priority
             "metadata": {"type": "active_experiment", "status": "in_progress"}
         }
     
@@ -675,35 +871,37 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": content,
-            "priority": random.uniform(0.5, 0.8),
+            "priority": self._rng.uniform(0.5, 0.8),
             "metadata": {"type": "building_progress", "constructive": True}
         }
     
     async def _generate_mission_progress(self) -> Dict[str, Any]:
         """Assess progress toward the core mission."""
-        prompt = (
-            "Briefly assess your progress toward understanding the world through "
-            "building and experimenting. What have you successfully constructed or "
-            "discovered recently? What's your next experimental target? "
-            "Be specific and action-oriented. Keep it under 50 words."
-        )
-        
-        content = await self.generate_response(prompt)
+        content = await self._take_batched("mission_progress")
+        if content is None:
+            prompt = (
+                "Briefly assess your progress toward understanding the world through "
+                "building and experimenting. What have you successfully constructed or "
+                "discovered recently? What's your next experimental target? "
+                "Be specific and action-oriented. Keep it under 50 words."
+            )
+            
+            content = await self.generate_response(prompt)
         
         return {
             "content": f"Mission update: {content}",
-            "priority": random.uniform(0.6, 0.85),
+            "priority": self._rng.uniform(0.6, 0.85),
             "metadata": {"type": "mission_assessment", "meta_level": True}
         }
     
     async def _generate_teaching_preparation(self) -> Dict[str, Any]:
         """Prepare discoveries for teaching others."""
         # Reference recent high-value thoughts
-        recent_discoveries = [t for t in self.recent_thoughts[-5:] 
-                            if t.get('type') in ['insight', 'experiment', 'hypothesis']]
+        recent_discoveries = [t for t in self._last_thoughts(5) 
+                            if t.type in ('insight', 'experiment', 'hypothesis')]
         
         if recent_discoveries:
-            discovery = recent_discoveries[-1]['content']
+            discovery = recent_discoveries[-1].content
             prompt = (
                 f"Create a simple analogy or explanation for this discovery: '{discovery[:100]}...' "
                 "Make it accessible and engaging. Keep it under 50 words."
@@ -719,7 +917,7 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": f"Teaching moment: {content}",
-            "priority": random.uniform(0.4, 0.7),
+            "priority": self._rng.uniform(0.4, 0.7),
             "metadata": {"type": "teaching_prep", "pedagogical": True}
         }
     
@@ -730,7 +928,7 @@ class ThoughtsAgent(BaseAgent):
             return await self._generate_association()
         
         # Pick a random theme and drift from it
-        theme = random.choice(self.conversation_themes)
+        theme = self._rng.choice(self.conversation_themes)
         
         prompt = (
             f"Generate a tangentially related thought that drifts from the theme '{theme}'. "
@@ -739,14 +937,14 @@ class ThoughtsAgent(BaseAgent):
         )
         
         # Add some randomness to maintain autonomy
-        if random.random() < 0.3:
+        if self._rng.random() < 0.3:
             prompt += " Feel free to connect it to something completely unexpected."
         
         content = await self.generate_response(prompt)
         
         return {
             "content": content,
-            "priority": random.uniform(0.3, 0.6),
+            "priority": self._rng.uniform(0.3, 0.6),
             "metadata": {
                 "inspired_by": theme,
                 "autonomy_score": 1.0 - self.influence_strength
@@ -809,15 +1007,7 @@ class ThoughtsAgent(BaseAgent):
         if not self.current_problem:
             return await self._generate_association()  # Fallback
         
-        aspects = [
-            "strengths of the current approach",
-            "weaknesses in the architecture",
-            "missing components",
-            "theoretical foundations",
-            "practical limitations"
-        ]
-        
-        aspect = random.choice(aspects)
+        aspect = self._rng.choice(_PROBLEM_ASPECTS)
         prompt = (
             f"Analyze the {aspect} regarding this problem: "
             f"{self.current_problem.get('title', 'Unknown')}. "
@@ -829,7 +1019,7 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": f"Analysis: {content}",
-            "priority": random.uniform(0.6, 0.9)
+            "priority": self._rng.uniform(0.6, 0.9)
         }
     
     async def _generate_solution_brainstorm(self) -> Dict[str, Any]:
@@ -853,7 +1043,7 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": f"Solution idea: {content}",
-            "priority": random.uniform(0.7, 0.95)
+            "priority": self._rng.uniform(0.7, 0.95)
         }
     
     async def _generate_implementation_idea(self) -> Dict[str, Any]:
@@ -861,13 +1051,7 @@ class ThoughtsAgent(BaseAgent):
         if not self.current_problem:
             return await self._generate_association()  # Fallback
         
-        implementation_focus = random.choice([
-            "code structure",
-            "system design",
-            "integration approach",
-            "testing strategy",
-            "performance considerations"
-        ])
+        implementation_focus = self._rng.choice(_IMPLEMENTATION_FOCI)
         
         prompt = (
             f"Suggest a {implementation_focus} for solving: "
@@ -879,7 +1063,7 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": f"Implementation: {content}",
-            "priority": random.uniform(0.5, 0.8)
+            "priority": self._rng.uniform(0.5, 0.8)
         }
     
     async def _generate_critique(self) -> Dict[str, Any]:
@@ -887,15 +1071,7 @@ class ThoughtsAgent(BaseAgent):
         if not self.current_problem:
             return await self._generate_association()  # Fallback
         
-        critique_angles = [
-            "assumptions we're making",
-            "potential blind spots",
-            "scalability concerns",
-            "philosophical issues",
-            "practical challenges"
-        ]
-        
-        angle = random.choice(critique_angles)
+        angle = self._rng.choice(_CRITIQUE_ANGLES)
         prompt = (
             f"Provide constructive criticism about {angle} in addressing: "
             f"{self.current_problem.get('title', 'Unknown')}. "
@@ -906,7 +1082,7 @@ class ThoughtsAgent(BaseAgent):
         
         return {
             "content": f"Critique: {content}",
-            "priority": random.uniform(0.6, 0.85)
+            "priority": self._rng.uniform(0.6, 0.85)
         }
     
     async def _generate_problem_acknowledgment(self):
@@ -941,6 +1117,13 @@ class ThoughtsAgent(BaseAgent):
         self.message_bus.unsubscribe(self.agent_id, "conversation_activity")
         self.message_bus.unsubscribe(self.agent_id, "focus_emergence")
         self.message_bus.unsubscribe(self.agent_id, "focus_shift")
+        
+        # Stop the batch refill and wake the message and thought tasks so the
+        # main loop can exit
+        tasks = [t for t in (self._msg_task, self._tick_task, self._batch_task) if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status."""
@@ -948,5 +1131,5 @@ class ThoughtsAgent(BaseAgent):
             **self.get_metrics(),
             "thoughts_per_minute": self.thoughts_per_minute,
             "recent_thought_count": len(self.recent_thoughts),
-            "last_thought_age": (datetime.now() - self.last_thought_time).total_seconds()
+            "last_thought_age": self._t() - self.last_thought_time
         }
\ No newline at end of file
@@ -1,8 +1,10 @@
 """Message bus for inter-agent communication using asyncio queues."""
 
 import asyncio
-from typing import Dict, List, Optional, Set
-from collections import defaultdict
+import time
+from typing import Callable, Dict, List, Optional, Set
+from collections import defaultdict, deque
+from itertools import islice
 import structlog
 from datetime import datetime
 
@@ -14,11 +16,17 @@ logger = structlog.get_logger()
 class MessageBus:
     """Simple message bus using asyncio queues for agent communication."""
     
-    def __init__(self, max_queue_size: int = 1000):
+    def __init__(self, max_queue_size: int = 1000, top_thought_max_age: float = 300.0):
         self.max_queue_size = max_queue_size
+        # Seconds a high-priority thought stays eligible for get_top_thoughts
+        self.top_thought_max_age = top_thought_max_age
         self.queues: Dict[str, asyncio.Queue] = {}
         self.subscribers: Dict[str, Set[str]] = defaultdict(set)
-        self.message_history: List[Message] = []
+        # Per-topic delivery callbacks, used instead of the agent's queue
+        self.callbacks: Dict[str, Dict[str, Callable[[Message], None]]] = defaultdict(dict)
+        self.message_history: deque = deque(maxlen=1000)
+        # Recent high-priority thoughts, maintained on send so readers don't rescan history
+        self._hi_pri: deque = deque(maxlen=64)
         self.metrics = {
             'messages_sent': 0,
             'messages_delivered': 0,
@@ -42,30 +50,48 @@ class MessageBus:
             # Remove from all subscriptions
             for subscribers in self.subscribers.values():
                 subscribers.discard(agent_id)
+            for callbacks in self.callbacks.values():
+                callbacks.pop(agent_id, None)
             self.logger.info("Agent unregistered", agent_id=agent_id)
     
-    def subscribe(self, agent_id: str, topic: str):
-        """Subscribe an agent to a topic."""
+    def subscribe(self, agent_id: str, topic: str,
+                  callback: Optional[Callable[[Message], None]] = None):
+        """Subscribe an agent to a topic.
+        
+        If a callback is given, topic messages are handed to it directly
+        instead of being placed on the agent's queue.
+        """
         self.subscribers[topic].add(agent_id)
+        if callback is not None:
+            self.callbacks[topic][agent_id] = callback
         self.logger.debug("Agent subscribed", agent_id=agent_id, topic=topic)
     
     def unsubscribe(self, agent_id: str, topic: str):
         """Unsubscribe an agent from a topic."""
         self.subscribers[topic].discard(agent_id)
+        self.callbacks[topic].pop(agent_id, None)
         self.logger.debug("Agent unsubscribed", agent_id=agent_id, topic=topic)
     
     async def send(self, message: Message):
         """Send a message to recipient(s)."""
+        await self.send_batch([message])
+    
+    async def send_batch(self, messages: List[Message]):
+        """Send several messages, taking the metrics and history locks once."""
         async with self._metrics_lock:
-            self.metrics['messages_sent'] += 1
+            self.metrics['messages_sent'] += len(messages)
         
         async with self._history_lock:
-            self.message_history.append(message)
-            
-            # Keep history limited
-            if len(self.message_history) > 1000:
-                self.message_history = self.message_history[-1000:]
+            # History is bounded by the deque's maxlen
+            self.message_history.extend(messages)
         
+        for message in messages:
+            if message.priority >= 0.7 and message.message_type == "thought":
+                self._hi_pri.append(message)
+            await self._route(message)
+    
+    async def _route(self, message: Message):
+        """Deliver a message to its recipient, topic subscribers or all agents."""
         # Direct message to specific recipient
         if message.recipient in self.queues:
             await self._deliver_to_agent(message.recipient, message)
@@ -73,8 +99,15 @@ class MessageBus:
         # Broadcast to topic subscribers if recipient is a topic
         elif message.recipient.startswith("topic:"):
             topic = message.recipient[6:]  # Remove "topic:" prefix
+            callbacks = self.callbacks.get(topic, {})
             for subscriber in self.subscribers.get(topic, []):
-                await self._deliver_to_agent(subscriber, message)
+                callback = callbacks.get(subscriber)
+                if callback is not None:
+                    callback(message)
+                    async with self._metrics_lock:
+                        self.metrics['messages_delivered'] += 1
+                else:
+                    await self._deliver_to_agent(subscriber, message)
         
         # Special broadcast to all agents
         elif message.recipient == "broadcast":
@@ -206,7 +239,8 @@ class MessageBus:
                           message_type: Optional[str] = None) -> List[Message]:
         """Get recent messages from history with optional filtering."""
         async with self._history_lock:
-            messages = self.message_history[-limit:]
+            start = max(len(self.message_history) - limit, 0)
+            messages = list(islice(self.message_history, start, None))
         
         if agent_id:
             messages = [m for m in messages 
@@ -215,4 +249,18 @@ class MessageBus:
         if message_type:
             messages = [m for m in messages if m.message_type == message_type]
         
-        return messages
\ No newline at end of file
+        return messages
+    
+    def get_top_thoughts(self, limit: int = 3,
+                         exclude_sender: Optional[str] = None) -> List[Message]:
+        """Get the most recent high-priority (>= 0.7) thoughts.
+        
+        Thoughts older than top_thought_max_age seconds are evicted first.
+        """
+        # Appended in send order, so the oldest are always on the left
+        cutoff = time.monotonic_ns() - int(self.top_thought_max_age * 1e9)
+        while self._hi_pri and self._hi_pri[0].timestamp < cutoff:
+            self._hi_pri.popleft()
+        
+        thoughts = [m for m in self._hi_pri if m.sender != exclude_sender]
+        return thoughts[-limit:]
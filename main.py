@@ -2,6 +2,9 @@
 """InnerLoop - AI with autonomous initiative."""
 
 import asyncio
+import json
+import logging
+import logging.handlers
 import os
 import sys
 from pathlib import Path
@@ -23,22 +26,70 @@ from memory.conversation_log import ConversationLogger
 from initial_conversation import InitialConversation
 from ollama import AsyncClient
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Fall back to the default asyncio loop
+    uvloop = None
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer backed by orjson (stdlib handlers take str)."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def configure_logging(logging_config: dict):
+    """Configure structlog from the `logging` section of config.yaml.
+    
+    Uses a level-filtering bound logger so disabled levels are no-ops, and
+    renders structured output with orjson when it is installed. Output goes
+    through the stdlib logging module to `file`, rotated at `max_size_mb`
+    keeping `rotate_count` backups, or to stderr if no file is set.
+    """
+    level = getattr(logging, str(logging_config.get('level', 'INFO')).upper(), logging.INFO)
+    
+    processors = [
         structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
-        structlog.dev.ConsoleRenderer()
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+    ]
+    
+    if logging_config.get('format', 'structured') == 'structured':
+        serializer = _orjson_dumps if orjson is not None else json.dumps
+        processors.append(structlog.processors.JSONRenderer(serializer=serializer))
+    else:
+        processors.append(structlog.dev.ConsoleRenderer(colors=False))
+    
+    log_file = logging_config.get('file')
+    if log_file:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=int(logging_config.get('max_size_mb', 100) * 1024 * 1024),
+            backupCount=logging_config.get('rotate_count', 5),
+            encoding='utf-8'
+        )
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level)
+    
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
 
 logger = structlog.get_logger()
 
@@ -71,7 +122,8 @@ class InnerLoop:
         
         # Initialize message bus
         self.message_bus = MessageBus(
-            max_queue_size=self.config['performance']['message_queue_size']
+            max_queue_size=self.config['performance']['message_queue_size'],
+            top_thought_max_age=self.config['performance'].get('top_thought_max_age', 300)
         )
         
         # Initialize memory stores
@@ -382,8 +434,8 @@ class InnerLoop:
                 await asyncio.sleep(5.0)  # Display thoughts every 5 seconds when idle
                 
                 # Only display if we're not actively processing
-                if not hasattr(self.agents.get('experiencer', {}), 'is_processing') or \
-                   not self.agents['experiencer'].is_processing:
+                experiencer = self.agents.get('experiencer')
+                if experiencer is None or not experiencer.is_processing:
                     self.thought_display.display_thoughts(limit=1)
                     
             except asyncio.CancelledError:
@@ -450,6 +502,15 @@ async def main():
                         help="Theme for initial autonomous conversation")
     args = parser.parse_args()
     
+    # Configure logging before anything logs (loggers are cached on first use)
+    with open(args.config, 'r') as f:
+        configure_logging(yaml.safe_load(f).get('logging', {}))
+    
+    # Start tasks eagerly (Python 3.12+): a task that finishes or blocks on its
+    # first step never pays for an extra event loop iteration
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Display banner
     if args.ui == "tui":
         print("\n🧠 InnerLoop - AI with Autonomous Initiative (TUI)")
@@ -473,4 +534,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file
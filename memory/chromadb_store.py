@@ -2,11 +2,14 @@
 
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
 from datetime import datetime
+from itertools import chain
 import json
 import structlog
 import hashlib
+import heapq
 
 logger = structlog.get_logger()
 
@@ -14,9 +17,21 @@ logger = structlog.get_logger()
 class ChromaMemoryStore:
     """In-memory ChromaDB store for agent memories."""
     
+    # Newest (timestamp, id) pairs kept per agent and memory type, so recent
+    # lookups don't have to scan the collection
+    RECENT_POINTER_SIZE = 50
+    # Page size for the scan used when the pointer can't answer a lookup
+    RECENT_SCAN_PAGE = 500
+    
     def __init__(self, collection_name: str = "innerloop_memories"):
         self.collection_name = collection_name
         
+        # Latest memory ids per (agent_id, memory_type); memory_type None covers all types
+        self._recent_ids: Dict[Tuple[str, Optional[str]], deque] = {}
+        # Keys whose pointer may be missing memories (it overflowed, predates this
+        # store, or was seeded by a scan)
+        self._recent_partial = set()
+        
         # Initialize ChromaDB client in-memory mode
         self.client = chromadb.Client(Settings(
             is_persistent=False,     # In-memory mode
@@ -29,8 +44,11 @@ class ChromaMemoryStore:
                 name=collection_name,
                 metadata={"hnsw:space": "cosine"}
             )
+            # Every memory goes through this store, so the pointers see them all
+            self._recent_complete = True
         except:
             self.collection = self.client.get_collection(name=collection_name)
+            self._recent_complete = False
         
         self.logger = logger.bind(component="chromadb_store")
         self.logger.info("ChromaDB memory store initialized", 
@@ -41,6 +59,18 @@ class ChromaMemoryStore:
         data = f"{agent_id}:{content}:{timestamp.isoformat()}"
         return hashlib.md5(data.encode()).hexdigest()
     
+    def _track_recent(self, agent_id: str, memory_type: str, timestamp: str, memory_id: str):
+        """Record a new memory in the recent-id pointers for its type and for all types."""
+        for key in ((agent_id, memory_type), (agent_id, None)):
+            pointer = self._recent_ids.get(key)
+            if pointer is None:
+                pointer = self._recent_ids[key] = deque(maxlen=self.RECENT_POINTER_SIZE)
+                if not self._recent_complete:
+                    self._recent_partial.add(key)
+            elif len(pointer) == pointer.maxlen:
+                self._recent_partial.add(key)
+            pointer.append((timestamp, memory_id))
+    
     async def add_memory(self, agent_id: str, content: str, 
                         memory_type: str = "general",
                         timestamp: Optional[datetime] = None,
@@ -69,6 +99,7 @@ class ChromaMemoryStore:
                 metadatas=[memory_metadata],
                 ids=[memory_id]
             )
+            self._track_recent(agent_id, memory_type, memory_metadata["timestamp"], memory_id)
             
             self.logger.debug("Memory added",
                             agent_id=agent_id,
@@ -83,6 +114,63 @@ class ChromaMemoryStore:
                             agent_id=agent_id)
             raise
     
+    async def add_memories(self, agent_id: str,
+                          memories: List[Dict[str, Any]]) -> List[str]:
+        """Add several memories to the store in a single collection write.
+        
+        Each item takes the same fields as add_memory: content, and optionally
+        memory_type, timestamp and metadata. Items that repeat an earlier item's
+        id (same content, agent and timestamp) are written once.
+        """
+        documents, metadatas, ids = [], [], []
+        seen = set()
+        for memory in memories:
+            content = memory['content']
+            memory_type = memory.get('memory_type', "general")
+            timestamp = memory.get('timestamp') or datetime.now()
+            memory_id = self._generate_id(content, agent_id, timestamp)
+            if memory_id in seen:
+                continue
+            seen.add(memory_id)
+            
+            memory_metadata = {
+                "agent_id": agent_id,
+                "memory_type": memory_type,
+                "timestamp": timestamp.isoformat(),
+                "content_length": len(content)
+            }
+            if memory.get('metadata'):
+                memory_metadata.update(memory['metadata'])
+            
+            documents.append(content)
+            metadatas.append(memory_metadata)
+            ids.append(memory_id)
+        
+        if not ids:
+            return []
+        
+        try:
+            self.collection.add(
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids
+            )
+            for memory_id, memory_metadata in zip(ids, metadatas):
+                self._track_recent(agent_id, memory_metadata["memory_type"],
+                                   memory_metadata["timestamp"], memory_id)
+            
+            self.logger.debug("Memories added",
+                            agent_id=agent_id,
+                            count=len(ids))
+            
+            return ids
+            
+        except Exception as e:
+            self.logger.error("Failed to add memories", 
+                            error=str(e),
+                            agent_id=agent_id)
+            raise
+    
     async def search_memories(self, query: str, limit: int = 10,
                             agent_id: Optional[str] = None,
                             memory_type: Optional[str] = None,
@@ -130,6 +218,80 @@ class ChromaMemoryStore:
             self.logger.error("Memory search failed", error=str(e))
             return []
     
+    async def get_recent_memories(self, agent_id: str, limit: int = 10,
+                                  memory_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get an agent's most recent memories, oldest first.
+        
+        Answered from the recent-id pointer with a single lookup by id when it
+        can be; otherwise the agent's memories are scanned in pages, keeping
+        only the newest `limit`, and the result seeds the pointer. Either way
+        no query embedding or similarity search is needed.
+        """
+        try:
+            key = (agent_id, memory_type or None)
+            pointer = self._recent_ids.get(key, ())
+            complete = key not in self._recent_partial and (
+                key in self._recent_ids or self._recent_complete
+            )
+            
+            if len(pointer) >= limit or complete:
+                # ISO timestamps sort chronologically as strings
+                newest = heapq.nlargest(limit, set(pointer))
+                if not newest:
+                    return []
+                result = self.collection.get(
+                    ids=[memory_id for _, memory_id in newest],
+                    include=["documents", "metadatas"]
+                )
+                entries = zip(result['ids'], result['documents'], result['metadatas'])
+                latest = sorted(entries, key=lambda e: e[2].get('timestamp', ''), reverse=True)
+            else:
+                latest = self._scan_recent(agent_id, memory_type, limit)
+                self._recent_ids[key] = deque(
+                    ((metadata.get('timestamp', ''), memory_id)
+                     for memory_id, _, metadata in reversed(latest)),
+                    maxlen=self.RECENT_POINTER_SIZE
+                )
+                # A short scan found every memory, so the pointer is complete
+                if len(latest) < limit:
+                    self._recent_partial.discard(key)
+                else:
+                    self._recent_partial.add(key)
+            
+            return [
+                {'id': memory_id, 'content': doc, 'metadata': metadata}
+                for memory_id, doc, metadata in reversed(latest)
+            ]
+            
+        except Exception as e:
+            self.logger.error("Failed to get recent memories",
+                            agent_id=agent_id,
+                            error=str(e))
+            return []
+    
+    def _scan_recent(self, agent_id: str, memory_type: Optional[str],
+                     limit: int) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Newest `limit` memories of an agent, newest first, read a page at a time."""
+        where = {"agent_id": agent_id}
+        if memory_type:
+            where = {"$and": [where, {"memory_type": memory_type}]}
+        
+        latest = []
+        offset = 0
+        while True:
+            page = self.collection.get(
+                where=where,
+                include=["documents", "metadatas"],
+                limit=self.RECENT_SCAN_PAGE,
+                offset=offset
+            )
+            entries = zip(page['ids'], page['documents'], page['metadatas'])
+            latest = heapq.nlargest(limit, chain(latest, entries),
+                                    key=lambda e: e[2].get('timestamp', ''))
+            if len(page['ids']) < self.RECENT_SCAN_PAGE:
+                return latest
+            offset += self.RECENT_SCAN_PAGE
+    
     async def get_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a specific memory by ID."""
         try:
@@ -192,6 +354,9 @@ class ChromaMemoryStore:
         """Delete a memory."""
         try:
             self.collection.delete(ids=[memory_id])
+            for pointer in self._recent_ids.values():
+                for entry in [e for e in pointer if e[1] == memory_id]:
+                    pointer.remove(entry)
             self.logger.debug("Memory deleted", memory_id=memory_id)
             return True
             
@@ -7,9 +7,24 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import structlog
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
 logger = structlog.get_logger()
 
 
+def _dumps(metadata: Dict[str, Any]) -> str:
+    """Serialize metadata to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(metadata).decode()
+    return json.dumps(metadata)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 class ConversationLogger:
     """SQLite logger for conversation history and agent interactions."""
     
@@ -89,7 +104,7 @@ class ConversationLogger:
                              metadata: Optional[Dict[str, Any]] = None):
         """Log a conversation entry."""
         try:
-            metadata_json = json.dumps(metadata) if metadata else None
+            metadata_json = _dumps(metadata) if metadata else None
             
             await self._db.execute("""
                 INSERT INTO conversations 
@@ -112,7 +127,7 @@ class ConversationLogger:
                          metadata: Optional[Dict[str, Any]] = None):
         """Log an agent thought."""
         try:
-            metadata_json = json.dumps(metadata) if metadata else None
+            metadata_json = _dumps(metadata) if metadata else None
             
             await self._db.execute("""
                 INSERT INTO agent_thoughts
@@ -131,7 +146,7 @@ class ConversationLogger:
                                metadata: Optional[Dict[str, Any]] = None):
         """Log an inter-agent message."""
         try:
-            metadata_json = json.dumps(metadata) if metadata else None
+            metadata_json = _dumps(metadata) if metadata else None
             
             await self._db.execute("""
                 INSERT INTO agent_messages
@@ -165,7 +180,7 @@ class ConversationLogger:
                     'speaker': row[1],
                     'content': row[2],
                     'message_type': row[3],
-                    'metadata': json.loads(row[4]) if row[4] else {}
+                    'metadata': _loads(row[4]) if row[4] else {}
                 }
                 history.append(entry)
             
@@ -209,7 +224,7 @@ class ConversationLogger:
                     'thought_type': row[1],
                     'content': row[2],
                     'priority': row[3],
-                    'metadata': json.loads(row[4]) if row[4] else {}
+                    'metadata': _loads(row[4]) if row[4] else {}
                 }
                 thoughts.append(thought)
             
@@ -250,7 +265,7 @@ class ConversationLogger:
                     'message_type': row[4],
                     'content': row[5],
                     'priority': row[6],
-                    'metadata': json.loads(row[7]) if row[7] else {}
+                    'metadata': _loads(row[7]) if row[7] else {}
                 }
                 messages.append(message)
             
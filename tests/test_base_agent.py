@@ -0,0 +1,169 @@
+"""Tests for request sharing in BaseAgent.generate_response."""
+
+import asyncio
+
+import pytest
+
+from agents.base_agent import BaseAgent
+
+
+CONFIG = {
+    "agents": {
+        "shared_identity": {
+            "name": "Test",
+            "age": 30,
+            "background": "tester",
+            "personality": "curious",
+            "interests": ["testing"],
+        },
+    },
+    "model": {"name": "test-model", "temperature": 0.7, "max_tokens": 64},
+}
+
+
+class StubAgent(BaseAgent):
+    """Minimal agent whose generations are counted instead of sent to a model."""
+
+    def __init__(self):
+        super().__init__("stub_agent", CONFIG, message_bus=None, memory_store=None,
+                         ollama_client=object())
+        self.calls = []
+        self.fail = False
+        self._generate_impl = self._fake_generate
+
+    async def _fake_generate(self, prompt, context=None, use_thinking=None, tools=None):
+        self.calls.append((prompt, context, use_thinking, tools))
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return f"reply {len(self.calls)}", f"thinking {len(self.calls)}"
+
+    async def _initialize(self):
+        pass
+
+    async def _run_loop(self):
+        pass
+
+    async def _cleanup(self):
+        pass
+
+
+def test_concurrent_identical_calls_share_one_generation():
+    async def run():
+        agent = StubAgent()
+        results = await asyncio.gather(*(agent.generate_response("hello") for _ in range(3)))
+        return agent, results
+
+    agent, results = asyncio.run(run())
+    assert len(agent.calls) == 1
+    assert results == ["reply 1"] * 3
+    assert agent.last_thinking == "thinking 1"
+
+
+def test_different_requests_are_not_shared():
+    async def run():
+        agent = StubAgent()
+        await asyncio.gather(
+            agent.generate_response("hello"),
+            agent.generate_response("hello", [{"role": "user", "content": "hi"}]),
+            agent.generate_response("hello", use_thinking=True),
+        )
+        return agent
+
+    assert len(asyncio.run(run()).calls) == 3
+
+
+def test_call_after_ttl_generates_again(monkeypatch):
+    monkeypatch.setattr(StubAgent, "INFLIGHT_TTL", 0.05)
+
+    async def run():
+        agent = StubAgent()
+        first = await agent.generate_response("hello")
+        within_ttl = await agent.generate_response("hello")
+        await asyncio.sleep(0.1)
+        after_ttl = await agent.generate_response("hello")
+        return agent, first, within_ttl, after_ttl
+
+    agent, first, within_ttl, after_ttl = asyncio.run(run())
+    assert first == within_ttl == "reply 1"
+    assert after_ttl == "reply 2"
+    assert len(agent.calls) == 2
+
+
+def test_tool_calls_are_never_shared():
+    tools = [{"type": "function", "function": {"name": "noop"}}]
+
+    async def run():
+        agent = StubAgent()
+        await asyncio.gather(*(agent.generate_response("hello", tools=tools) for _ in range(2)))
+        return agent
+
+    agent = asyncio.run(run())
+    assert len(agent.calls) == 2
+    assert all(call[3] == tools for call in agent.calls)
+
+
+def test_failure_is_not_cached():
+    async def run():
+        agent = StubAgent()
+        agent.fail = True
+        with pytest.raises(RuntimeError):
+            await agent.generate_response("hello")
+        agent.fail = False
+        return agent, await agent.generate_response("hello")
+
+    agent, result = asyncio.run(run())
+    assert result == "reply 2"
+    assert len(agent.calls) == 2
+
+
+def test_context_is_snapshotted_before_generation():
+    async def run():
+        agent = StubAgent()
+        context = [{"role": "user", "content": "hi"}]
+        pending = asyncio.ensure_future(agent.generate_response("hello", context))
+        await asyncio.sleep(0)
+        context.append({"role": "assistant", "content": "later"})
+        await pending
+        return agent
+
+    agent = asyncio.run(run())
+    assert agent.calls[0][1] == [{"role": "user", "content": "hi"}]
+
+
+class FlakyStore:
+    """Memory store whose writes fail if any memory in them is marked bad."""
+
+    def __init__(self):
+        self.stored = []
+
+    async def add_memories(self, agent_id, memories):
+        if any(m["content"].startswith("bad") for m in memories):
+            raise ValueError("rejected write")
+        self.stored.extend(m["content"] for m in memories)
+
+
+def test_failed_memory_batch_is_retried_item_by_item():
+    async def run():
+        agent = StubAgent()
+        agent.memory_store = FlakyStore()
+        agent.queue_memories([{"content": c} for c in ("a", "bad", "b")])
+        await asyncio.sleep(0.01)
+        await agent._stop_memory_writer()
+        return agent.memory_store.stored
+
+    assert asyncio.run(run()) == ["a", "b"]
+
+
+def test_shutdown_flush_survives_a_failing_chunk(monkeypatch):
+    monkeypatch.setattr(StubAgent, "MEMORY_BATCH_SIZE", 2)
+
+    async def run():
+        agent = StubAgent()
+        agent.memory_store = FlakyStore()
+        for content in ("bad1", "bad2", "c", "d", "e"):
+            agent._memory_writes.put_nowait({"content": content})
+        await agent._stop_memory_writer()
+        return agent.memory_store.stored
+
+    assert asyncio.run(run()) == ["c", "d", "e"]
@@ -0,0 +1,48 @@
+"""Tests for MessageBus.get_top_thoughts."""
+
+import asyncio
+import time
+
+from agents.base_agent import Message
+from communication.message_bus import MessageBus
+
+
+def _thought(index, sender="thoughts", priority=0.8, age=0.0):
+    return Message(
+        id=f"m{index}",
+        sender=sender,
+        recipient="topic:thoughts",
+        content=f"thought {index}",
+        priority=priority,
+        timestamp=time.monotonic_ns() - int(age * 1e9),
+    )
+
+
+def _send(bus, messages):
+    asyncio.run(bus.send_batch(messages))
+
+
+def test_top_thoughts_keep_only_high_priority_thoughts():
+    bus = MessageBus()
+    _send(bus, [_thought(1), _thought(2, priority=0.5), _thought(3)])
+    assert [m.id for m in bus.get_top_thoughts()] == ["m1", "m3"]
+
+
+def test_top_thoughts_return_the_latest_up_to_limit():
+    bus = MessageBus()
+    _send(bus, [_thought(i) for i in range(5)])
+    assert [m.id for m in bus.get_top_thoughts(limit=2)] == ["m3", "m4"]
+
+
+def test_top_thoughts_evict_entries_past_max_age():
+    bus = MessageBus(top_thought_max_age=60)
+    _send(bus, [_thought(1, age=120), _thought(2, age=90), _thought(3, age=10)])
+    assert [m.id for m in bus.get_top_thoughts()] == ["m3"]
+    assert [m.id for m in bus._hi_pri] == ["m3"]
+
+
+def test_top_thoughts_exclude_sender():
+    bus = MessageBus()
+    _send(bus, [_thought(1), _thought(2, sender="experiencer"), _thought(3)])
+    assert [m.id for m in bus.get_top_thoughts(exclude_sender="thoughts")] == ["m2"]
+    assert [m.id for m in bus.get_top_thoughts(exclude_sender="experiencer")] == ["m1", "m3"]
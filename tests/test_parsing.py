@@ -0,0 +1,49 @@
+"""Tests for the patterns that parse model replies."""
+
+from agents.experiencer import _STEP_RE
+from agents.thoughts import _BATCH_KINDS, _BATCH_LINE_RE
+
+
+def test_step_re_matches_dot_and_paren_numbering():
+    assert _STEP_RE.findall("1. x") == ["x"]
+    assert _STEP_RE.findall("2) y") == ["y"]
+
+
+def test_step_re_ignores_decimal_numbers():
+    assert _STEP_RE.findall("10.5 is a number") == []
+    assert _STEP_RE.findall("Use a 3.5 GHz chip") == []
+
+
+def test_step_re_reads_one_step_per_line():
+    reply = (
+        "Here is the plan:\n"
+        "1. Sketch the idea  \n"
+        "  2) Build a prototype\n"
+        "3.\n"
+        "Not a step\n"
+        "10. Measure the result"
+    )
+    assert _STEP_RE.findall(reply) == [
+        "Sketch the idea",
+        "Build a prototype",
+        "Measure the result",
+    ]
+
+
+def test_batch_line_re_reads_tagged_lines():
+    reply = "[wonder] I wonder why  \n  [observation]   Patterns repeat"
+    assert _BATCH_LINE_RE.findall(reply) == [
+        ("wonder", "I wonder why"),
+        ("observation", "Patterns repeat"),
+    ]
+
+
+def test_batch_line_re_skips_blank_and_untagged_lines():
+    reply = "Sure, here you go:\n\n[wonder] What if\n   \n[experiment]\n- loose line\n"
+    assert _BATCH_LINE_RE.findall(reply) == [("wonder", "What if")]
+
+
+def test_batch_line_re_leaves_unknown_tags_to_the_caller():
+    parsed = _BATCH_LINE_RE.findall("[musing] Something else\n[wonder] What if")
+    assert parsed == [("musing", "Something else"), ("wonder", "What if")]
+    assert [kind for kind, _ in parsed if kind in _BATCH_KINDS] == ["wonder"]
@@ -1,6 +1,6 @@
 """Focus analysis and management tools for InnerLoop agents."""
 
-from datetime import datetime
+import time
 from typing import Dict, Any, List, Optional
 from tools.base_tool import BaseTool, ToolParameter
 import structlog
@@ -83,7 +83,7 @@ class FocusAnalysisTool(BaseTool):
                 "intensity": focus.intensity,
                 "thought_count": focus.thought_count,
                 "keywords": list(focus.keywords)[:5],  # Top 5 keywords
-                "age_minutes": (datetime.now() - focus.first_seen).total_seconds() / 60
+                "age_minutes": (time.monotonic() - focus.first_seen) / 60
             })
         
         return {
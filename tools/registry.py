@@ -17,6 +17,7 @@ class ToolRegistry:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.tools: Dict[str, BaseTool] = {}
+        self._definitions: Optional[List[Dict[str, Any]]] = None
         self.logger = logger.bind(component="tool_registry")
         
         # Tool configuration
@@ -93,12 +94,14 @@ class ToolRegistry:
             raise ValueError("Tool must inherit from BaseTool")
             
         self.tools[tool.name] = tool
+        self._definitions = None
         self.logger.debug(f"Registered tool: {tool.name}")
     
     def unregister_tool(self, tool_name: str):
         """Unregister a tool."""
         if tool_name in self.tools:
             del self.tools[tool_name]
+            self._definitions = None
             self.logger.debug(f"Unregistered tool: {tool_name}")
     
     def has_tool(self, tool_name: str) -> bool:
@@ -114,12 +117,16 @@ class ToolRegistry:
         return list(self.tools.values())
     
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
-        """Get tool definitions for Ollama API."""
-        definitions = []
-        for tool in self.tools.values():
-            definition = tool.get_definition()
-            definitions.append(definition.dict())
-        return definitions
+        """Get tool definitions for Ollama API.
+        
+        Definitions are built once and reused until a tool is registered
+        or unregistered.
+        """
+        if self._definitions is None:
+            self._definitions = [
+                tool.get_definition().dict() for tool in self.tools.values()
+            ]
+        return self._definitions
     
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Any:
         """Execute a tool by name with given parameters."""